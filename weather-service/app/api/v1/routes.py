@@ -2,26 +2,38 @@
 This module defines the routes for API version 1.
 """
 
-from fastapi import APIRouter, Query, Depends, HTTPException, Response, Request
+from fastapi import APIRouter, Query, Depends, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 
-from app.api.v1.crud import WeatherCRUD
-from app.schemas.api_v1 import WeatherResponse
+from app.schemas.api_v1 import WeatherResponse, weather_response_adapter
 from app.services.weather_service import WeatherService, ApiVersion
 from app.utils.dependencies import get_weather_service
 from app.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
-router = APIRouter(prefix=f"/{ApiVersion.V1.value}", tags=[ApiVersion.V1.value])
+API_VERSION = ApiVersion.V1.value
 
+router = APIRouter(prefix=f"/{API_VERSION}", tags=[API_VERSION])
 
-@router.get("/weather", response_model=WeatherResponse, deprecated=True)
+DEPRECATION_HEADERS = {
+    "X-API-Deprecation": "true",
+    "X-API-Deprecation-Date": "2024-12-31",
+    "X-API-Deprecation-Info": "Please migrate to v2 API",
+}
+
+
+@router.get(
+    "/weather",
+    response_class=ORJSONResponse,
+    responses={200: {"model": WeatherResponse}},
+    deprecated=True,
+)
 async def get_weather_v1(
     request: Request,
-    response: Response,
     city: str = Query(..., description="City name", min_length=1, max_length=100),
     weather_service: WeatherService = Depends(get_weather_service),
-) -> WeatherResponse:
+) -> Response:
     """
     Get weather data for a specific city (V1 API - Simple Format).
 
@@ -30,25 +42,39 @@ async def get_weather_v1(
 
     Returns weather data in the original challenge format with temperature as
     string including unit.
+
+    The response is serialized once by a precompiled `TypeAdapter` and
+    returned directly, so FastAPI skips `jsonable_encoder` and response
+    model re-validation. Fresh responses are cached pre-serialized, so a hit
+    is returned byte-for-byte.
     """
     try:
-        response.headers["X-API-Deprecation"] = "true"
-        response.headers["X-API-Deprecation-Date"] = "2024-12-31"
-        response.headers["X-API-Deprecation-Info"] = "Please migrate to v2 API"
+        cached_response = await weather_service.get_cached_response(city, ApiVersion.V1)
+        if cached_response:
+            return Response(
+                content=cached_response,
+                media_type="application/json",
+                headers=DEPRECATION_HEADERS,
+            )
 
         weather_data = await weather_service.get_weather(city, ApiVersion.V1)
-        return WeatherCRUD.transform_internal(weather_data)
+        return Response(
+            content=weather_response_adapter.dump_json(weather_data),
+            media_type="application/json",
+            headers=DEPRECATION_HEADERS,
+        )
 
     except Exception as e:
+        request_id = request.state.request_id
         logger.error(
             "Error getting weather",
             extra={
                 "event": "api_error",
-                "api_version": "v1",
+                "api_version": API_VERSION,
                 "city": city,
                 "error": str(e),
                 "error_type": type(e).__name__,
-                "request_id": request.state.request_id,
+                "request_id": request_id,
             },
         )
         raise HTTPException(
@@ -56,6 +82,6 @@ async def get_weather_v1(
             detail={
                 "error": "Internal server error",
                 "detail": "Failed to retrieve weather data",
-                "request_id": request.state.request_id,
+                "request_id": request_id,
             },
         ) from e
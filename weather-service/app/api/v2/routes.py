@@ -2,16 +2,21 @@
 This module defines the routes for API version 2.
 """
 
+import asyncio
 from datetime import datetime, UTC
+from typing import Awaitable, Callable, Union
 
+import orjson
 import redis.asyncio as redis
-from fastapi import APIRouter, Query, Request, HTTPException, Depends
+from cachetools import TTLCache
+from fastapi import APIRouter, Query, Request, HTTPException, Depends, Response
 
 from app.config import get_settings
 from app.schemas.api_v2 import (
     WeatherResponseV2,
     HealthResponse,
     MetricsResponse,
+    weather_response_v2_adapter,
 )
 from app.services.dummy_external_api import dummy_weather_api
 from app.services.rate_limit_service import RateLimitService
@@ -29,35 +34,82 @@ from app.utils.logger import setup_logger
 logger = setup_logger(__name__)
 settings = get_settings()
 
-router = APIRouter(prefix=f"/{ApiVersion.V2.value}", tags=[ApiVersion.V2.value])
+API_VERSION = ApiVersion.V2.value
+
+router = APIRouter(prefix=f"/{API_VERSION}", tags=[API_VERSION])
 default_router = APIRouter(tags=["default"])
 
+circuit_breaker = dummy_weather_api.circuit_breaker
+
+STATIC_METRICS = {"rate_limit_window_seconds": settings.rate_limit_window}
+
+_health_cache: TTLCache = TTLCache(maxsize=1, ttl=settings.health_cache_ttl)
+_health_lock = asyncio.Lock()
+_metrics_cache: TTLCache = TTLCache(maxsize=1, ttl=settings.metrics_cache_ttl)
+_metrics_lock = asyncio.Lock()
 
-@router.get("/weather", response_model=WeatherResponseV2)
+
+async def _get_cached_payload(
+    cache: TTLCache,
+    lock: asyncio.Lock,
+    build: Callable[[], Awaitable[Union[str, bytes]]],
+) -> Union[str, bytes]:
+    """
+    Return a serialized payload from a short-lived cache, building it on a miss.
+
+    The lock ensures a burst of concurrent requests on an expired entry
+    results in a single backend call instead of one per request.
+    """
+    payload = cache.get("payload")
+    if payload is None:
+        async with lock:
+            payload = cache.get("payload")
+            if payload is None:
+                payload = await build()
+                cache["payload"] = payload
+    return payload
+
+
+@router.get(
+    "/weather",
+    responses={200: {"model": WeatherResponseV2}},
+)
 async def get_weather_v2(
     request: Request,
     city: str = Query(..., description="City name", min_length=1, max_length=100),
     weather_service: WeatherService = Depends(get_weather_service),
-) -> WeatherResponseV2:
+) -> Response:
     """
     Get weather data for a specific city (V2 API - Enhanced Format).
 
     Returns weather data with additional metadata and enhanced information.
+    The response is serialized once by a precompiled `TypeAdapter` and
+    returned directly, so FastAPI skips `jsonable_encoder` and response
+    model re-validation. Fresh responses are cached pre-serialized, so a hit
+    is returned byte-for-byte.
     """
     try:
+        cached_response = await weather_service.get_cached_response(city, ApiVersion.V2)
+        if cached_response:
+            return Response(content=cached_response, media_type="application/json")
+
         weather_data = await weather_service.get_weather(city, ApiVersion.V2)
-        return weather_data
+        return Response(
+            content=weather_response_v2_adapter.dump_json(weather_data),
+            media_type="application/json",
+        )
 
     except Exception as e:
+        request_id = request.state.request_id
         logger.error(
             "Error getting weather",
             extra={
                 "event": "api_error",
-                "api_version": "v2",
+                "api_version": API_VERSION,
                 "city": city,
                 "error": str(e),
                 "error_type": type(e).__name__,
-                "request_id": request.state.request_id,
+                "request_id": request_id,
             },
         )
         raise HTTPException(
@@ -65,58 +117,90 @@ async def get_weather_v2(
             detail={
                 "error": "Internal server error",
                 "detail": "Failed to retrieve weather data",
-                "request_id": request.state.request_id,
+                "request_id": request_id,
             },
         ) from e
 
 
-@router.get("/health", response_model=HealthResponse)
+@router.get("/health", responses={200: {"model": HealthResponse}})
 async def health_check(
     request: Request,
     redis_client: redis.Redis = Depends(get_redis_client),
-):
+) -> Response:
     """
     Health check endpoint that returns service status.
+
+    The result is cached for `health_cache_ttl` seconds so frequent load
+    balancer probes collapse into a single Redis ping. The ping is bounded by
+    `health_ping_timeout` so a hung connection reports Redis as unhealthy
+    instead of stalling the probe.
     """
-    redis_status = "healthy"
-    try:
-        await redis_client.ping()
-    except Exception:
-        redis_status = "unhealthy"
 
-    circuit_status = dummy_weather_api.circuit_breaker.state
+    async def build() -> str:
+        redis_status = "healthy"
+        try:
+            await asyncio.wait_for(
+                redis_client.ping(), timeout=settings.health_ping_timeout
+            )
+        except (redis.RedisError, asyncio.TimeoutError, ConnectionError):
+            redis_status = "unhealthy"
+
+        circuit_status = circuit_breaker.state
+
+        return HealthResponse(
+            status="healthy" if redis_status == "healthy" else "degraded",
+            version=settings.app_version,
+            timestamp=datetime.now(UTC).isoformat(),
+            services={
+                "redis": redis_status,
+                "external_api_circuit_breaker": circuit_status,
+            },
+        ).model_dump_json()
 
-    return HealthResponse(
-        status="healthy" if redis_status == "healthy" else "degraded",
-        version=settings.app_version,
-        timestamp=datetime.now(UTC).isoformat(),
-        services={
-            "redis": redis_status,
-            "external_api_circuit_breaker": circuit_status,
-        },
-    )
+    payload = await _get_cached_payload(_health_cache, _health_lock, build)
+    return Response(content=payload, media_type="application/json")
 
 
-@router.get("/metrics", response_model=MetricsResponse)
+@router.get("/metrics", responses={200: {"model": MetricsResponse}})
 async def get_metrics(
     request: Request,
     stats_tracker: RequestStatsService = Depends(get_stats_tracker),
     rate_limiter: RateLimitService = Depends(get_rate_limiter),
-):
+) -> Response:
     """
     Metrics endpoint that returns rate limit status and top requested cities.
+
+    Both lookups are independent, so they are awaited concurrently. The
+    result is cached for `metrics_cache_ttl` seconds so scraper bursts
+    collapse into a single round of Redis calls. The payload only contains
+    trusted values from our own services, so it is serialized straight to
+    JSON with orjson instead of being validated through `MetricsResponse`.
     """
-    top_cities = await stats_tracker.get_top_cities(10)
-    rate_limit_remaining = await rate_limiter.get_rate_limit_remaining()
 
-    return MetricsResponse(
-        rate_limit_remaining=rate_limit_remaining,
-        rate_limit_window_seconds=settings.rate_limit_window,
-        circuit_breaker_status=dummy_weather_api.circuit_breaker.state,
-        top_cities=[{"city": city, "requests": count} for city, count in top_cities],
-    )
+    async def build() -> bytes:
+        top_cities, rate_limit_remaining = await asyncio.gather(
+            stats_tracker.get_top_cities(10),
+            rate_limiter.get_rate_limit_remaining(),
+        )
+
+        return orjson.dumps(
+            {
+                "rate_limit_remaining": rate_limit_remaining,
+                **STATIC_METRICS,
+                "circuit_breaker_status": circuit_breaker.state,
+                "top_cities": [
+                    {"city": city, "requests": count} for city, count in top_cities
+                ],
+            }
+        )
+
+    payload = await _get_cached_payload(_metrics_cache, _metrics_lock, build)
+    return Response(content=payload, media_type="application/json")
 
 
-default_router.get("/weather", response_model=WeatherResponseV2)(get_weather_v2)
-default_router.get("/health", response_model=HealthResponse)(health_check)
-default_router.get("/metrics", response_model=MetricsResponse)(get_metrics)
+default_router.get(
+    "/weather",
+    responses={200: {"model": WeatherResponseV2}},
+)(get_weather_v2)
+default_router.get("/health", responses={200: {"model": HealthResponse}})(health_check)
+default_router.get("/metrics", responses={200: {"model": MetricsResponse}})(get_metrics)
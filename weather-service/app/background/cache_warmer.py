@@ -3,11 +3,14 @@ This module handles the cache warming process.
 """
 
 import asyncio
+import math
 from datetime import date
-from typing import List, Tuple
+from typing import Final, List, NamedTuple, Optional, Tuple
+
+from aiolimiter import AsyncLimiter
 
 from app.config import get_settings
-from app.definitions.data_sources import DEFAULT_CITIES, ApiVersion
+from app.definitions.data_sources import DEFAULT_CITIES
 from app.services.rate_limit_service import RateLimitService
 from app.services.request_stats_service import RequestStatsService
 from app.services.weather_cache_service import WeatherCacheService
@@ -18,75 +21,204 @@ from app.utils.logger import setup_logger
 logger = setup_logger(__name__)
 settings = get_settings()
 
+HIGH_MISS_RATIO: Final[float] = 0.5
+
+_warm_lock = asyncio.Lock()
+
+DEFAULT_WARM_FALLBACK: Final[Tuple[Tuple[str, int], ...]] = tuple(
+    (city, 0) for city in DEFAULT_CITIES
+)
+
+
+class WarmResult(NamedTuple):
+    """Outcome of a single warm cycle, used to schedule the next one."""
+
+    failure_ratio: float = 0.0
+    miss_ratio: float = 0.0
+
+
+class WarmServices(NamedTuple):
+    """Services used by the cache warmer, built once per warmer task."""
+
+    weather_cache: WeatherCacheService
+    rate_limiter: RateLimitService
+    stats_tracker: RequestStatsService
+    weather_service: WeatherService
+
+
+async def create_warm_services() -> WarmServices:
+    """
+    Build the services the cache warmer needs on the shared Redis client.
+
+    Returns:
+        WarmServices bound to the application's Redis pool
+    """
+    redis_pool = await get_redis_pool()
+    redis_client = await redis_pool.get_client()
+
+    weather_cache = WeatherCacheService(redis_client)
+    rate_limiter = RateLimitService(redis_client)
+    stats_tracker = RequestStatsService(redis_client)
+    weather_service = WeatherService(
+        weather_cache=weather_cache,
+        rate_limiter=rate_limiter,
+        stats_tracker=stats_tracker,
+        queue_manager=None,  # Not needed for cache warming in Demo
+    )
+    return WarmServices(weather_cache, rate_limiter, stats_tracker, weather_service)
+
 
 async def warm_single_city(
-    city: str, weather_service, semaphore: asyncio.Semaphore
-) -> None:
+    city: str, weather_service, outbound_limiter: AsyncLimiter
+) -> bool:
     """
-    Warm cache for a single city with concurrency control.
+    Warm cache for a single city.
 
-    This function fetches weather data for a city to ensure it's cached.
-    Uses a semaphore to limit concurrent requests and prevent overwhelming
-    the external API.
+    This function fetches fresh weather data for a city, bypassing any cached
+    copy so entries close to expiry are actually refreshed. The rate limit
+    token for the fetch is reserved up front by `warm_cache`, and request
+    statistics are not counted, so warming does not feed its own ranking.
+    The outbound fetch is paced by a local leaky bucket (`outbound_limiter`)
+    so the external API never sees a burst larger than
+    `cache_warm_rate_per_sec`.
 
     Args:
         city: City name to warm cache for
         weather_service: Weather service instance to use
-        semaphore: Asyncio semaphore for concurrency control
+        outbound_limiter: Leaky bucket shared by the cycle's workers
+
+    Returns:
+        True if the city was warmed, False if the fetch failed
     """
-    async with semaphore:
+    try:
+        async with outbound_limiter:
+            refreshed = await weather_service.refresh_weather(city)
+        if not refreshed:
+            logger.warning("Failed to warm cache for %s", city)
+            return False
+        logger.debug("Warmed cache for %s", city)
+        return True
+    except Exception as e:
+        logger.error("Failed to warm cache for %s: %s", city, e)
+        return False
+
+
+async def warm_worker(
+    queue: asyncio.Queue, weather_service, outbound_limiter: AsyncLimiter
+) -> List:
+    """
+    Warm cities from a shared queue until it is empty.
+
+    A fixed pool of these workers bounds how many fetches are in flight
+    without a semaphore acquire/release around every city.
+
+    Args:
+        queue: Queue of city names to warm
+        weather_service: Weather service instance to use
+        outbound_limiter: Leaky bucket shared by the cycle's workers
+
+    Returns:
+        The `warm_single_city` result for each city this worker handled
+    """
+    results = []
+    while True:
         try:
-            await weather_service.get_weather(city, ApiVersion.V2)
-            logger.debug("Warmed cache for %s", city)
-        except Exception as e:
-            logger.error("Failed to warm cache for %s: %s", city, e)
+            city = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return results
+        results.append(await warm_single_city(city, weather_service, outbound_limiter))
+
+
+def _elapsed_ttl_fraction(ttl: Optional[int]) -> float:
+    """
+    Fraction of the cache TTL that has elapsed for an entry.
+
+    Unknown TTLs (and keys that expired since they were read) count as
+    fully elapsed; keys without expiry never need a refresh.
+    """
+    if ttl == -1:
+        return 0.0
+    if ttl is None or ttl < 0:
+        return 1.0
+    return max(0.0, 1.0 - ttl / settings.redis_cache_ttl)
 
 
 async def get_cities_to_warm(
-    stats_tracker, weather_cache, max_cities: int
-) -> List[Tuple[str, int]]:
+    stats_tracker,
+    weather_cache,
+    max_cities: int,
+    today_date: Optional[str] = None,
+    top_cities: Optional[List[Tuple[str, int]]] = None,
+) -> Tuple[List[Tuple[str, int]], float]:
     """
     Get prioritized list of cities to warm based on usage statistics.
 
     This function retrieves the most requested cities and prioritizes
     those without cached data. If no statistics are available, it falls
-    back to a default list of cities.
+    back to a default list of cities. Cache status for all candidates is
+    checked with a single batched lookup.
 
-    The prioritization strategy:
+    The prioritization strategy scores each city by its expected miss cost:
     1. Cities without cache come first (they need warming most)
-    2. Cities with cache come second (to refresh if needed)
-    3. Limited to max_cities to control resource usage
+    2. Cached cities are ranked by request count weighted by how much of
+       their TTL has elapsed, so entries close to expiry are refreshed
+       before recently cached ones
+    3. Limited to max_cities to control resource usage; when every
+       candidate fits, they are returned in request-count order unscored
 
     Args:
         stats_tracker: Request statistics service
         weather_cache: Weather cache service to check existing cache
         max_cities: Maximum number of cities to return
+        today_date: ISO date to check the cache for (defaults to today)
+        top_cities: Already fetched top cities, most requested first; fetched
+            from the stats tracker when not given
 
     Returns:
-        List of tuples containing (city_name, request_count)
+        List of tuples containing (city_name, request_count), and the
+        fraction of top cities that were not cached (0.0 without stats)
     """
-    top_cities = await stats_tracker.get_top_cities(max_cities * 2)
+    if top_cities is None:
+        top_cities = await stats_tracker.get_top_cities(max_cities * 2)
+    else:
+        top_cities = top_cities[: max_cities * 2]
 
     if not top_cities:
-        return [(city, 0) for city in DEFAULT_CITIES[:max_cities]]
+        return list(DEFAULT_WARM_FALLBACK[:max_cities]), 0.0
 
-    today_date = date.today().isoformat()
+    if today_date is None:
+        today_date = date.today().isoformat()
+
+    cached = await weather_cache.get_many([city for city, _ in top_cities], today_date)
+
+    missing_count = sum(1 for cached_data, _ in cached if not cached_data)
+    miss_ratio = missing_count / len(top_cities)
+
+    # Every candidate will be warmed, so there is nothing to choose between.
+    if len(top_cities) <= max_cities:
+        return list(top_cities), miss_ratio
 
-    cities_needing_cache = []
-    cities_with_cache = []
+    scored = [
+        (
+            math.inf if not cached_data else count * _elapsed_ttl_fraction(ttl),
+            city,
+            count,
+        )
+        for (city, count), (cached_data, ttl) in zip(top_cities, cached)
+    ]
+
+    # Stable sort keeps the request-count order among equal scores.
+    scored.sort(key=lambda entry: entry[0], reverse=True)
+    return [(city, count) for _, city, count in scored[:max_cities]], miss_ratio
 
-    for city, count in top_cities:
-        cached_data = await weather_cache.get_weather(city, today_date)
-        if cached_data:
-            cities_with_cache.append((city, count))
-        else:
-            cities_needing_cache.append((city, count))
 
-    prioritized = cities_needing_cache + cities_with_cache
-    return prioritized[:max_cities]
+def _retrieve_task_exception(task: asyncio.Task) -> None:
+    """Mark a task's exception as retrieved; the awaiting path reports it."""
+    if not task.cancelled():
+        task.exception()
 
 
-async def warm_cache(app):  # pylint: disable=unused-argument,too-many-locals
+async def warm_cache(app, services: Optional[WarmServices] = None) -> WarmResult:
     """
     Warms the cache by fetching weather data for top cities concurrently.
 
@@ -98,107 +230,205 @@ async def warm_cache(app):  # pylint: disable=unused-argument,too-many-locals
     - Handles failures gracefully without affecting the entire process
 
     The warming process:
-    1. Check rate limit status and calculate safe token usage
+    1. Check rate limit status (concurrently with fetching the top cities)
+       and calculate safe token usage, skipping the cycle (without the
+       cache lookups) if fewer than `cache_warm_min_dispatch` cities could
+       be warmed
     2. Get prioritized list of cities needing cache updates
-    3. Warm caches concurrently with semaphore-based throttling
-    4. Log results for monitoring and debugging
+    3. Reserve one rate limit token per city in a single bulk reservation
+       and drop the cities that did not get a token
+    4. Warm caches with a fixed pool of workers draining a shared queue,
+       run in a TaskGroup so cancelling the warmer cancels in-flight warms;
+       the workers share a leaky bucket created for the cycle, so it is
+       bound to the event loop running it
+    5. Log results for monitoring and debugging
+
+    Only one cycle runs at a time per process; a call made while another
+    cycle is in progress is skipped instead of doubling external API traffic.
 
     Args:
         app: FastAPI application instance
+        services: Services to warm with; built on demand when not given
+
+    Returns:
+        WarmResult with the fraction of attempted cities that failed to warm
+        and the fraction of top cities found uncached (both 0.0 when the
+        cycle was skipped)
     """
-    redis_pool = await get_redis_pool()
-    redis_client = await redis_pool.get_client()
+    if _warm_lock.locked():
+        logger.info("Cache warming already in progress, skipping")
+        return WarmResult()
 
-    weather_cache = WeatherCacheService(redis_client)
-    rate_limiter = RateLimitService(redis_client)
-    stats_tracker = RequestStatsService(redis_client)
-    weather_service = WeatherService(
-        weather_cache=weather_cache,
-        rate_limiter=rate_limiter,
-        stats_tracker=stats_tracker,
-        queue_manager=None,  # Not needed for cache warming in Demo
+    async with _warm_lock:
+        return await _run_warm_cycle(app, services)
+
+
+async def _run_warm_cycle(  # pylint: disable=unused-argument,too-many-locals
+    app, services: Optional[WarmServices]
+) -> WarmResult:
+    """
+    Run one cache warming cycle; see `warm_cache`.
+    """
+    if services is None:
+        services = await create_warm_services()
+    weather_cache, rate_limiter, stats_tracker, weather_service = services
+
+    min_tokens_remaining = settings.cache_warm_min_tokens_remaining
+    today_date = date.today().isoformat()
+
+    # The stats lookup does not depend on the token budget, so fetch the
+    # largest candidate list we could use alongside the rate limit check.
+    top_cities_task = asyncio.create_task(
+        stats_tracker.get_top_cities(settings.cache_warm_max_tokens * 2)
     )
+    top_cities_task.add_done_callback(_retrieve_task_exception)
 
     try:
         remaining_tokens = await rate_limiter.get_rate_limit_remaining()
 
-        if remaining_tokens < settings.cache_warm_min_tokens_remaining:
+        if remaining_tokens < min_tokens_remaining:
             logger.info(
                 "Skipping cache warming: only %s tokens remaining", remaining_tokens
             )
-            return
+            return WarmResult()
 
         tokens_to_use = min(
             settings.cache_warm_max_tokens,
             int(remaining_tokens * 0.2),
-            remaining_tokens - settings.cache_warm_min_tokens_remaining,
+            remaining_tokens - min_tokens_remaining,
         )
 
-        if tokens_to_use <= 0:
-            logger.info("No tokens available for cache warming")
-            return
+        if tokens_to_use < max(1, settings.cache_warm_min_dispatch):
+            logger.info(
+                "Skipping cache warming: only %s tokens available", tokens_to_use
+            )
+            return WarmResult()
 
-        cities_to_warm = await get_cities_to_warm(
-            stats_tracker, weather_cache, tokens_to_use
+        top_cities = await top_cities_task
+        cities_to_warm, miss_ratio = await get_cities_to_warm(
+            stats_tracker, weather_cache, tokens_to_use, today_date, top_cities
         )
 
+        if not cities_to_warm:
+            logger.info("No cities to warm")
+            return WarmResult()
+
+        granted = await rate_limiter.try_consume_many(len(cities_to_warm))
+        if granted <= 0:
+            logger.warning("Rate limit reached before cache warming")
+            return WarmResult()
+        cities_to_warm = cities_to_warm[:granted]
+
         logger.info(
             "Warming cache for %s cities concurrently",
             len(cities_to_warm),
         )
 
-        max_concurrent = min(5, len(cities_to_warm))
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        tasks = []
+        queue: asyncio.Queue = asyncio.Queue()
         for city, _ in cities_to_warm:
-            if await rate_limiter.consume_rate_limit_token():
-                task = warm_single_city(city, weather_service, semaphore)
-                tasks.append(task)
-            else:
-                logger.warning("Rate limit reached during cache warming")
-                break
-
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            warmed_count = sum(1 for r in results if r is True)
-            logger.info("Cache warming completed: warmed %s cities", warmed_count)
-        else:
-            logger.info("No cities warmed due to rate limiting")
+            queue.put_nowait(city)
+
+        outbound_limiter = AsyncLimiter(settings.cache_warm_rate_per_sec, 1)
+        worker_count = min(settings.cache_warm_concurrency, len(cities_to_warm))
+        async with asyncio.TaskGroup() as task_group:
+            workers = [
+                task_group.create_task(
+                    warm_worker(queue, weather_service, outbound_limiter)
+                )
+                for _ in range(worker_count)
+            ]
+        results = [result for worker in workers for result in worker.result()]
+        warmed_count = sum(1 for r in results if r is True)
+        failed_count = len(cities_to_warm) - warmed_count
+        logger.info(
+            "Cache warming completed: warmed %s cities, %s failed",
+            warmed_count,
+            failed_count,
+        )
+        return WarmResult(failed_count / len(cities_to_warm), miss_ratio)
 
     except Exception as e:
         logger.error("Cache warming failed: %s", e)
+        return WarmResult(failure_ratio=1.0)
+    finally:
+        # The lookup is already on the wire when a cycle is skipped, and
+        # cancelling it would only make redis-py drop the pooled connection,
+        # so let it finish; its result or error is discarded.
+        await asyncio.wait([top_cities_task])
+
+
+def next_warm_interval(interval: float, miss_ratio: float) -> float:
+    """
+    Adapt the warm interval to how useful the last cycle was.
+
+    Halves the interval when most top cities were uncached and doubles it
+    otherwise, clamped to `cache_warm_min_interval`..`cache_warm_max_interval`.
+
+    Args:
+        interval: Interval used after the previous cycle, in seconds
+        miss_ratio: Fraction of top cities found uncached in the last cycle
+
+    Returns:
+        Interval to wait before the next cycle, in seconds
+    """
+    factor = 0.5 if miss_ratio > HIGH_MISS_RATIO else 2.0
+    return min(
+        max(interval * factor, settings.cache_warm_min_interval),
+        settings.cache_warm_max_interval,
+    )
 
 
 async def cache_warmer_task(app):
     """
     Continuously runs the cache warming task.
 
-    This background task runs indefinitely, periodically warming the cache
-    based on the configured interval. It includes error handling to ensure
-    the task continues running even if individual warming attempts fail.
+    This background task runs indefinitely, periodically warming the cache.
+    It starts from the configured interval and adapts it after each cycle
+    with `next_warm_interval`, warming more often while top cities keep
+    missing the cache and backing off while they are already cached. It
+    includes error handling to ensure the task continues running even if
+    individual warming attempts fail.
 
     The task lifecycle:
     1. Initial delay to let the application fully start
-    2. Continuous loop executing cache warming
+    2. Continuous loop executing cache warming, reusing the services built
+       on the first iteration
     3. Graceful cancellation handling for shutdown
-    4. Error recovery with backoff on failures
+    4. Error recovery with backoff on failures, including runs where the
+       failure ratio reaches `cache_warm_failure_threshold`
 
     Args:
         app: FastAPI application instance
     """
-    await asyncio.sleep(30)
+    interval = settings.cache_warm_interval
+    failure_threshold = settings.cache_warm_failure_threshold
+    retry_delay = settings.cache_warm_retry_delay
+    services = None
+
+    await asyncio.sleep(settings.cache_warm_initial_delay)
 
     while True:
         try:
-            await warm_cache(app)
-            await asyncio.sleep(settings.cache_warm_interval)
+            if services is None:
+                services = await create_warm_services()
+            result = await warm_cache(app, services)
+            if result.failure_ratio >= failure_threshold:
+                logger.warning(
+                    "Cache warming failure ratio %.0f%%, retrying in %ss",
+                    result.failure_ratio * 100,
+                    retry_delay,
+                )
+                await asyncio.sleep(retry_delay)
+                continue
+            interval = next_warm_interval(interval, result.miss_ratio)
+            logger.debug("Next cache warming in %ss", interval)
+            await asyncio.sleep(interval)
         except asyncio.CancelledError:
             logger.info("Cache warmer task cancelled")
             break
         except Exception as e:
             logger.error("Cache warmer error: %s", e)
-            await asyncio.sleep(60)
+            await asyncio.sleep(retry_delay)
 
 
 async def start_cache_warmer(app):
@@ -213,12 +443,17 @@ async def start_cache_warmer(app):
         app: FastAPI application instance
 
     Returns:
-        asyncio.Task or None: The created task if warming is enabled,
-                              None if disabled
+        asyncio.Task or None: The created (or already running) task if
+                              warming is enabled, None if disabled
     """
     if not settings.enable_cache_warming:
         logger.info("Cache warming is disabled")
         return None
 
+    existing = getattr(app.state, "cache_warmer_task", None)
+    if isinstance(existing, asyncio.Task) and not existing.done():
+        logger.info("Cache warmer already running")
+        return existing
+
     task = asyncio.create_task(cache_warmer_task(app))
     return task
@@ -2,7 +2,6 @@
 This module contains configuration settings for the application.
 """
 
-from functools import lru_cache
 from typing import Optional, List
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -20,16 +19,43 @@ class Settings(BaseSettings):
     app_name: str = "Weather Service API"
     app_version: str = "1.0.0"
     log_level: str = "INFO"
+    enable_docs: bool = True
+
+    # Server settings (used when running `python -m app.main`)
+    uvicorn_reload: bool = False
+    uvicorn_workers: int = 1
+    uvicorn_access_log: bool = False
 
     # External API settings
     weather_api_url: str = "https://api.example.com/weather"
     weather_api_timeout: int = 10
 
+    # Dummy API simulation settings (0 disables the delay or the errors)
+    dummy_api_delay_min: float = 0.1
+    dummy_api_delay_max: float = 0.3
+    dummy_api_error_rate: float = 0.05
+
     # Redis settings
     redis_url: str = "redis://localhost:6379"
     redis_cache_ttl: int = 3600
     redis_stale_ttl: int = 86400
+    redis_response_ttl: int = 300
+    redis_pool_size: int = 200
     redis_decode_responses: bool = True
+    redis_health_check_interval: int = 30
+
+    # In-process response cache settings
+    local_cache_ttl: int = 60
+    local_cache_max_size: int = 1024
+
+    # Monitoring endpoint settings
+    enable_metrics: bool = True
+    health_cache_ttl: float = 1.0
+    health_ping_timeout: float = 0.2
+    metrics_cache_ttl: float = 2.0
+
+    # Request stats settings
+    top_cities_capacity: int = 1000
 
     # Rate limiting settings
     rate_limit_requests: int = 100
@@ -38,9 +64,17 @@ class Settings(BaseSettings):
     # Cache warming settings
     enable_cache_warming: bool = True
     cache_warm_interval: int = 3600
+    cache_warm_min_interval: int = 600
+    cache_warm_max_interval: int = 14400
     top_cities_count: int = 10
     cache_warm_max_tokens: int = 20
     cache_warm_min_tokens_remaining: int = 50
+    cache_warm_min_dispatch: int = 3
+    cache_warm_concurrency: int = 5
+    cache_warm_rate_per_sec: float = 5.0
+    cache_warm_failure_threshold: float = 0.5
+    cache_warm_initial_delay: int = 30
+    cache_warm_retry_delay: int = 60
 
     # Circuit breaker settings
     circuit_breaker_failure_threshold: int = 5
@@ -60,9 +94,18 @@ class Settings(BaseSettings):
     cors_allow_headers: List[str] = ["*"]
 
 
-@lru_cache()
+_settings: Optional[Settings] = None
+
+
 def get_settings() -> Settings:
     """
     Get the application settings.
+
+    Created on first use and reused afterwards so the environment and `.env`
+    file are parsed only once; modules bind the result to a module-level
+    `settings` at import time.
     """
-    return Settings()
+    global _settings  # pylint: disable=global-statement
+    if _settings is None:
+        _settings = Settings()
+    return _settings
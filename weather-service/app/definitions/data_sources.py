@@ -2,8 +2,8 @@
 This module defines data sources for the application.
 """
 
-from enum import Enum
-from typing import Literal, List
+from enum import Enum, StrEnum
+from typing import Final, Literal, Tuple
 
 
 class ApiVersion(Enum):
@@ -15,7 +15,7 @@ DataSource = Literal["cache", "api", "unavailable"]
 DataFreshness = Literal["fresh", "stale", "unavailable"]
 TemperatureUnit = Literal["celsius", "fahrenheit"]
 
-DEFAULT_CITIES: List[str] = [
+DEFAULT_CITIES: Final[Tuple[str, ...]] = (
     "London",
     "New York",
     "Tokyo",
@@ -26,10 +26,10 @@ DEFAULT_CITIES: List[str] = [
     "Singapore",
     "Dubai",
     "Toronto",
-]
+)
 
 
-class WeatherCondition(str, Enum):
+class WeatherCondition(StrEnum):
     """Enumeration of possible weather conditions."""
 
     CLEAR = "Clear"
@@ -42,7 +42,7 @@ class WeatherCondition(str, Enum):
     WINDY = "Windy"
 
 
-class WindDirections(str, Enum):
+class WindDirections(StrEnum):
     """Enumeration of possible wind directions."""
 
     N = "N"
@@ -5,8 +5,9 @@ This module is the entry point for the application.
 from contextlib import asynccontextmanager
 
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from prometheus_fastapi_instrumentator import Instrumentator
 
 from app.api.v1 import routes as v1_routes
@@ -20,6 +21,15 @@ from app.utils.logger import setup_logger
 logger = setup_logger(__name__)
 settings = get_settings()
 
+# Docs, health probes and the scrape endpoint itself are not worth a histogram
+METRICS_EXCLUDED_HANDLERS = [
+    "/docs",
+    "/redoc",
+    "/openapi.json",
+    "/prometheus-metrics",
+    "/health",
+]
+
 
 @asynccontextmanager
 async def lifespan(fastapi_app: FastAPI):
@@ -47,9 +57,10 @@ app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     lifespan=lifespan,
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
+    docs_url="/docs" if settings.enable_docs else None,
+    redoc_url="/redoc" if settings.enable_docs else None,
+    openapi_url="/openapi.json" if settings.enable_docs else None,
 )
 
 app.add_middleware(
@@ -62,17 +73,59 @@ app.add_middleware(
 
 app.add_middleware(RequestIDMiddleware)
 
-Instrumentator().instrument(app).expose(app, endpoint="/prometheus-metrics")
 
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """
+    Turn exceptions that escape the routes into a JSON 500 response.
+
+    Starlette only invokes this on the error path, so successful requests
+    pay nothing for it. It runs outside `RequestIDMiddleware`, so the
+    request ID is added to the response headers here.
+    """
+    request_id = getattr(request.state, "request_id", None)
+    logger.error(
+        "Unhandled error",
+        extra={
+            "event": "unhandled_error",
+            "path": request.url.path,
+            "error": str(exc),
+            "error_type": type(exc).__name__,
+            "request_id": request_id,
+        },
+    )
+    return ORJSONResponse(
+        status_code=500,
+        content={
+            "detail": {"error": "Internal server error", "request_id": request_id}
+        },
+        headers={"X-Request-ID": request_id} if request_id else None,
+    )
+
+
+# Routes are matched in order, so API routes come before the scrape endpoint
 app.include_router(v1_routes.router)
 app.include_router(v2_routes.router)
 app.include_router(v2_routes.default_router)
 
+if settings.enable_metrics:
+    Instrumentator(
+        excluded_handlers=METRICS_EXCLUDED_HANDLERS,
+        should_group_status_codes=True,
+        should_ignore_untemplated=True,
+    ).instrument(app).expose(
+        app, endpoint="/prometheus-metrics", include_in_schema=False
+    )
+
 if __name__ == "__main__":
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=settings.uvicorn_reload,
+        workers=settings.uvicorn_workers,
+        loop="uvloop",
+        http="httptools",
+        access_log=settings.uvicorn_access_log,
         log_level=settings.log_level.lower(),
     )
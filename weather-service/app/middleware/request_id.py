@@ -2,28 +2,65 @@
 This module provides request ID tracking for the application.
 """
 
-import time
-import uuid
+import re
+from os import urandom
+from time import time_ns
+from typing import Optional
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+REQUEST_ID_HEADER = b"x-request-id"
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+# Client-supplied IDs are reused only if they are short, visible ASCII
+VALID_REQUEST_ID = re.compile(rb"[\x21-\x7e]{1,128}")
+
+
+class RequestIDMiddleware:
     """
     Lightweight middleware that adds unique request IDs for tracing.
 
     This middleware focuses solely on request identification without
-    duplicating monitoring functionality provided by Prometheus.
+    duplicating monitoring functionality provided by Prometheus. It is a
+    plain ASGI middleware rather than a `BaseHTTPMiddleware`, so requests
+    are not wrapped in an extra task group and response stream.
+
+    A valid `X-Request-ID` sent by the client or an upstream gateway is kept,
+    so the ID correlates across services; otherwise a new one is generated.
     """
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Add unique request ID to request state and response headers.
         """
-        request_id = f"req_{uuid.uuid4().hex[:8]}_{int(time.time() * 1000)}"
-        request.state.request_id = request_id
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        incoming = _incoming_request_id(scope)
+        if incoming is not None:
+            request_id = incoming.decode("ascii")
+            header = (REQUEST_ID_HEADER, incoming)
+        else:
+            request_id = f"req_{urandom(4).hex()}_{time_ns() // 1_000_000}"
+            header = (REQUEST_ID_HEADER, request_id.encode("ascii"))
+        scope.setdefault("state", {})["request_id"] = request_id
 
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
-        return response
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), header]
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
+
+
+def _incoming_request_id(scope: Scope) -> Optional[bytes]:
+    """
+    Return the request's `X-Request-ID` header if it is safe to reuse.
+    """
+    for name, value in scope["headers"]:
+        if name == REQUEST_ID_HEADER:
+            return value if VALID_REQUEST_ID.fullmatch(value) else None
+    return None
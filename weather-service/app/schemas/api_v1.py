@@ -4,7 +4,7 @@ This module defines schemas for API version 1.
 
 from typing import List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 from app.schemas.common import BaseHourlyWeather
 
@@ -25,4 +25,9 @@ class WeatherResponse(BaseModel):
     Contains only the essential weather information without metadata.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     weather: List[HourlyWeather]
+
+
+weather_response_adapter = TypeAdapter(WeatherResponse)
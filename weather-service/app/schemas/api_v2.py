@@ -5,7 +5,7 @@ This module defines schemas for API version 2.
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
-from pydantic import Field, field_validator, BaseModel
+from pydantic import ConfigDict, Field, BaseModel, TypeAdapter
 
 from app.definitions.data_sources import (
     TemperatureUnit,
@@ -13,7 +13,6 @@ from app.definitions.data_sources import (
     DataFreshness,
     DataSource,
 )
-from app.exceptions.common import ValidationError
 from app.schemas.common import BaseHourlyWeather
 
 
@@ -22,6 +21,8 @@ class WeatherMetadata(BaseModel):
     V2 weather metadata model.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     last_updated: datetime = Field(..., description="Last update timestamp")
     data_freshness: DataFreshness = Field(..., description="Data freshness indicator")
     source: DataSource = Field(..., description="Data source")
@@ -40,20 +41,10 @@ class HourlyWeatherV2(BaseHourlyWeather):
         None, ge=0, le=100, description="Humidity percentage"
     )
     wind_speed: Optional[int] = Field(None, ge=0, description="Wind speed in km/h")
-    wind_direction: Optional[str] = Field(
+    wind_direction: Optional[WindDirections] = Field(
         None, description="Wind direction (N, NE, E, SE, S, SW, W, NW)"
     )
 
-    @field_validator("wind_direction")
-    @classmethod
-    def validate_wind_direction(cls, v: Optional[str]) -> Optional[str]:
-        wind_direction = [c.value for c in WindDirections]
-        if v and v not in wind_direction:
-            raise ValidationError(
-                f'Invalid wind direction. Must be one of: {", ".join(wind_direction)}'
-            )
-        return v
-
 
 class WeatherResponseV2(BaseModel):
     """
@@ -62,6 +53,8 @@ class WeatherResponseV2(BaseModel):
     Provides detailed hourly weather data with additional context for better UX.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     city: str = Field(..., description="City name")
     date: str = Field(..., description="Date in YYYY-MM-DD format")
     weather: List[HourlyWeatherV2] = Field(..., description="Hourly weather data")
@@ -71,6 +64,9 @@ class WeatherResponseV2(BaseModel):
     )
 
 
+weather_response_v2_adapter = TypeAdapter(WeatherResponseV2)
+
+
 class ErrorResponse(BaseModel):
     error: str = Field(..., description="Error message")
     detail: Optional[str] = Field(None, description="Detailed error information")
@@ -2,10 +2,9 @@
 This module defines common schemas used in the application.
 """
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.definitions.data_sources import WeatherCondition
-from app.exceptions.common import ValidationError
 
 
 class BaseHourlyWeather(BaseModel):
@@ -14,6 +13,7 @@ class BaseHourlyWeather(BaseModel):
 
     Common fields shared between all API versions and internal processing.
     Provides the foundation for version-specific weather hour models.
+    The condition is validated against `WeatherCondition` by pydantic-core.
 
     Attributes:
         hour: Hour of the day (0-23)
@@ -21,16 +21,8 @@ class BaseHourlyWeather(BaseModel):
         condition: Weather condition (e.g., 'Clear', 'Cloudy', 'Rainy')
     """
 
+    model_config = ConfigDict(frozen=True)
+
     hour: int = Field(..., ge=0, le=23, description="Hour of the day (0-23)")
     temperature: str = Field(..., description="Temperature value")
-    condition: str = Field(..., description="Weather condition")
-
-    @field_validator("condition")
-    @classmethod
-    def validate_condition(cls, v: str) -> str:
-        valid_conditions = [c.value for c in WeatherCondition]
-        if v not in valid_conditions:
-            raise ValidationError(
-                message=f'Invalid weather condition. Must be one of: {", ".join(valid_conditions)}'
-            )
-        return v
+    condition: WeatherCondition = Field(..., description="Weather condition")
@@ -4,59 +4,200 @@ This module simulates an external API for testing purposes.
 
 import asyncio
 import random
+import time
+from functools import lru_cache
 from datetime import datetime, UTC, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
 
+from app.config import get_settings
 from app.definitions.data_sources import WeatherCondition, WindDirections
 from app.utils.circuit_breaker import CircuitBreaker
 
+settings = get_settings()
+
+CLEAR_CONDITION = WeatherCondition.CLEAR.value
+WIND_DIRECTION_VALUES = tuple(direction.value for direction in WindDirections)
+HIGH_WIND_CONDITIONS = frozenset(
+    (WeatherCondition.STORMY.value, WeatherCondition.WINDY.value)
+)
+
+HOURS = range(24)
+HUMIDITY_OFFSETS = range(-5, 6)
+WIND_SPEED_RANGE = range(5, 26)
+HIGH_WIND_SPEED_RANGE = range(20, 41)
+PRESSURE_RANGE = range(1000, 1021)
+VISIBILITY_RANGE = range(5, 21)
+UV_INDEX_RANGE = range(0, 12)
+
+
+def _temperature_variation(hour: int) -> int:
+    """Temperature offset from the daily base: warming from 6am, cooling after 2pm."""
+    hour_offset = (hour - 6) % 24
+
+    if hour_offset <= 8:
+        return int(5 * (hour_offset / 8))
+    if hour_offset <= 16:
+        return int(5 * (1 - (hour_offset - 8) / 8))
+    return -2
+
+
+DOMINANT_CONDITION_SHARE = 0.8
+HOURLY_TEMP_VARIATION = tuple(_temperature_variation(hour) for hour in HOURS)
+TEMPERATURE_LABELS = {temp: f"{temp}°C" for temp in range(-50, 60)}
+
+ConditionTable = Tuple[Tuple[float, ...], Tuple[int, ...], Tuple[str, ...]]
+
+
+def build_condition_table(conditions: List[tuple]) -> ConditionTable:
+    """
+    Build a Walker alias table for sampling conditions by weight.
+
+    Uses Vose's algorithm: every slot keeps its own condition with
+    probability `prob[i]` and otherwise hands over to `alias[i]`, so a draw
+    costs one random number regardless of how many conditions there are.
+    """
+    count = len(conditions)
+    total = sum(probability for _, probability in conditions)
+    scaled = [probability * count / total for _, probability in conditions]
+    prob = [1.0] * count
+    alias = list(range(count))
+
+    small = [i for i, weight in enumerate(scaled) if weight < 1.0]
+    large = [i for i, weight in enumerate(scaled) if weight >= 1.0]
+    while small and large:
+        low, high = small.pop(), large.pop()
+        prob[low] = scaled[low]
+        alias[low] = high
+        scaled[high] += scaled[low] - 1.0
+        (small if scaled[high] < 1.0 else large).append(high)
+
+    return (
+        tuple(prob),
+        tuple(alias),
+        tuple(condition.value for condition, _ in conditions),
+    )
+
+
+def build_hourly_condition_tables(
+    conditions: List[tuple],
+) -> Dict[str, ConditionTable]:
+    """
+    Build one alias table per possible dominant condition for hourly draws.
+
+    Each hour keeps the day's dominant condition with probability
+    `DOMINANT_CONDITION_SHARE` and otherwise samples the city's weights, so
+    the two steps are folded into a single blended distribution.
+    """
+    total = sum(probability for _, probability in conditions)
+    other_share = 1.0 - DOMINANT_CONDITION_SHARE
+
+    return {
+        dominant.value: build_condition_table(
+            [
+                (
+                    condition,
+                    other_share * probability / total
+                    + (DOMINANT_CONDITION_SHARE if condition is dominant else 0.0),
+                )
+                for condition, probability in conditions
+            ]
+        )
+        for dominant, _ in conditions
+    }
+
+
+def sample_condition(table: ConditionTable) -> str:
+    """Draw a condition from a table built by `build_condition_table`."""
+    prob, alias, values = table
+    draw = random.random() * len(values)
+    slot = int(draw)
+    return values[slot] if draw - slot < prob[slot] else values[alias[slot]]
+
+
+class RateLimitSnapshot(NamedTuple):
+    """Token bucket state read from a single refill."""
+
+    remaining: int
+    seconds_until_reset: float
+    can_make_request: bool
+    window_age: Optional[float]
+
 
 class RateLimitTracker:
     """
     Simulates external API rate limiting (100 requests per hour).
 
-    This tracker maintains request counts and enforces the limit
-    to demonstrate how the application handles rate limiting.
+    This tracker enforces the limit as a token bucket: the bucket holds up to
+    `requests_per_hour` tokens and refills continuously at
+    `requests_per_hour / 3600` tokens per second, so capacity comes back
+    gradually instead of all at once when a fixed window rolls over.
     """
 
+    REFILL_PERIOD_SECONDS = 3600.0
+
     def __init__(self, requests_per_hour: int = 100):
         self.requests_per_hour = requests_per_hour
-        self.window_start: Optional[datetime] = None
+        self.refill_rate = requests_per_hour / self.REFILL_PERIOD_SECONDS
+        self.tokens = float(requests_per_hour)
+        self.last_refill = time.monotonic()
+        # Monotonic time of the first request since the bucket was last full
+        self.window_start: Optional[float] = None
         self.request_count = 0
 
-    def reset_window_if_needed(self) -> None:
-        """Reset the rate limit window if an hour has passed."""
-        current_time = datetime.now(UTC)
-
-        if self.window_start is None:
-            self.window_start = current_time
-            self.request_count = 0
-            return
-
-        if current_time - self.window_start >= timedelta(hours=1):
-            self.window_start = current_time
-            self.request_count = 0
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill, up to capacity."""
+        now = time.monotonic()
+        self.tokens = min(
+            self.requests_per_hour,
+            self.tokens + (now - self.last_refill) * self.refill_rate,
+        )
+        self.last_refill = now
 
     def can_make_request(self) -> bool:
         """Check if we can make a request within the rate limit."""
-        self.reset_window_if_needed()
-        return self.request_count < self.requests_per_hour
+        self._refill()
+        return self.tokens >= 1.0
 
     def record_request(self) -> None:
         """Record a request against the rate limit."""
-        self.reset_window_if_needed()
+        self._refill()
+        if self.tokens >= self.requests_per_hour:
+            self.window_start = self.last_refill
+        self.tokens = max(0.0, self.tokens - 1.0)
         self.request_count += 1
 
     def get_remaining_requests(self) -> int:
-        """Get the number of remaining requests in current window."""
-        self.reset_window_if_needed()
-        return max(0, self.requests_per_hour - self.request_count)
+        """Get the number of requests that can be made right now."""
+        self._refill()
+        return int(self.tokens)
+
+    def get_seconds_until_reset(self) -> float:
+        """Get the seconds until the next request is allowed."""
+        self._refill()
+        return max(0.0, (1.0 - self.tokens) / self.refill_rate)
+
+    def snapshot(self) -> RateLimitSnapshot:
+        """
+        Get the remaining requests, seconds until the next allowed request,
+        whether a request can be made and the seconds since the first request
+        that still counts against the limit (None while the bucket is full),
+        from a single refill.
+        """
+        self._refill()
+        tokens = self.tokens
+        window_age = None
+        if tokens < self.requests_per_hour and self.window_start is not None:
+            window_age = self.last_refill - self.window_start
+        return RateLimitSnapshot(
+            remaining=int(tokens),
+            seconds_until_reset=max(0.0, (1.0 - tokens) / self.refill_rate),
+            can_make_request=tokens >= 1.0,
+            window_age=window_age,
+        )
 
     def get_reset_time(self) -> datetime:
-        """Get when the rate limit window will reset."""
-        if self.window_start is None:
-            return datetime.now(UTC)
-        return self.window_start + timedelta(hours=1)
+        """Get when the next request will be allowed."""
+        return datetime.now(UTC) + timedelta(seconds=self.get_seconds_until_reset())
 
 
 class DummyWeatherAPI:
@@ -144,96 +285,80 @@ class DummyWeatherAPI:
 
     def get_weather_pattern(self, city: str) -> Dict[str, Any]:
         """Get weather pattern for a city."""
-        city_lower = city.lower()
-
-        for pattern_city, pattern in self.CITY_WEATHER_PATTERNS.items():
-            if pattern_city in city_lower:
-                return pattern
-
-        return self.CITY_WEATHER_PATTERNS["default"]
+        return _resolve_pattern(city.lower())
 
     def generate_temperature_curve(self, base_temp: int, hour: int) -> int:
         """Generate realistic temperature curve throughout the day."""
 
-        hour_offset = (hour - 6) % 24
-
-        if hour_offset <= 8:
-            variation = int(5 * (hour_offset / 8))
-        elif hour_offset <= 16:
-            variation = int(5 * (1 - (hour_offset - 8) / 8))
-        else:
-            variation = -2
-
-        return base_temp + variation
-
-    def select_weather_condition(self, conditions: List[tuple]) -> str:
-        """Select a weather condition based on probability weights."""
-        rand = random.random()
-        cumulative = 0.0
-
-        for condition, probability in conditions:
-            cumulative += probability
-            if rand <= cumulative:
-                return condition.value
+        return base_temp + HOURLY_TEMP_VARIATION[hour % 24]
 
-        return conditions[0][0].value
-
-    def _generate_hourly_data(
-        self, hour: int, base_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """
-        Generate weather data for a specific hour.
+    def _generate_hourly_series(
+        self, base_data: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
         """
-        temperature = self.generate_temperature_curve(base_data["base_temp"], hour)
-        humidity = self._calculate_humidity(base_data["base_humidity"])
-        wind_speed = self._calculate_wind_speed(base_data["dominant_condition"])
-        condition = self._select_hourly_condition(
-            base_data["dominant_condition"], base_data["pattern"]
-        )
-        feels_like = self._calculate_feels_like(temperature, wind_speed, humidity)
-
-        return {
-            "hour": hour,
-            "temperature": f"{temperature}°C",
-            "condition": condition,
-            "feels_like": feels_like,
-            "humidity": humidity,
-            "wind_speed": wind_speed,
-            "wind_direction": random.choice(list(WindDirections)).value,
-            "pressure": random.randint(1000, 1020),
-            "visibility": random.randint(5, 20),
-            "uv_index": (
-                random.randint(0, 11)
-                if condition == WeatherCondition.CLEAR.value
-                else 0
-            ),
-        }
+        Generate weather data for all 24 hours of a day.
 
-    def _calculate_humidity(self, base_humidity: int) -> int:
+        The random values for each field are drawn for the whole day in one
+        `random.choices` batch instead of one `randint` call per field per hour.
         """
-        Calculate humidity for an hour.
-        """
-        humidity = base_humidity + random.randint(-5, 5)
-        return max(0, min(100, humidity))
+        base_temp = base_data["base_temp"]
+        base_humidity = base_data["base_humidity"]
+        dominant_condition = base_data["dominant_condition"]
+        hourly_table = base_data["pattern"]["hourly_condition_tables"][
+            dominant_condition
+        ]
+        wind_range = (
+            HIGH_WIND_SPEED_RANGE
+            if dominant_condition in HIGH_WIND_CONDITIONS
+            else WIND_SPEED_RANGE
+        )
 
-    def _calculate_wind_speed(self, dominant_condition: str) -> int:
-        """
-        Calculate wind speed based on conditions.
-        """
-        if dominant_condition in [
-            WeatherCondition.STORMY.value,
-            WeatherCondition.WINDY.value,
-        ]:
-            return random.randint(20, 40)
-        return random.randint(5, 25)
-
-    def _select_hourly_condition(self, dominant_condition: str, pattern: Dict) -> str:
-        """
-        Select weather condition for an hour.
-        """
-        if random.random() < 0.8:
-            return dominant_condition
-        return self.select_weather_condition(pattern["conditions"])
+        conditions = [sample_condition(hourly_table) for _ in HOURS]
+        humidities = [
+            max(0, min(100, base_humidity + offset))
+            for offset in random.choices(HUMIDITY_OFFSETS, k=24)
+        ]
+
+        temperatures = [base_temp + variation for variation in HOURLY_TEMP_VARIATION]
+
+        return [
+            {
+                "hour": hour,
+                "temperature": TEMPERATURE_LABELS.get(temperature)
+                or f"{temperature}°C",
+                "condition": condition,
+                "feels_like": self._calculate_feels_like(
+                    temperature, wind_speed, humidity
+                ),
+                "humidity": humidity,
+                "wind_speed": wind_speed,
+                "wind_direction": wind_direction,
+                "pressure": pressure,
+                "visibility": visibility,
+                "uv_index": uv_index if condition == CLEAR_CONDITION else 0,
+            }
+            for (
+                hour,
+                temperature,
+                condition,
+                humidity,
+                wind_speed,
+                wind_direction,
+                pressure,
+                visibility,
+                uv_index,
+            ) in zip(
+                HOURS,
+                temperatures,
+                conditions,
+                humidities,
+                random.choices(wind_range, k=24),
+                random.choices(WIND_DIRECTION_VALUES, k=24),
+                random.choices(PRESSURE_RANGE, k=24),
+                random.choices(VISIBILITY_RANGE, k=24),
+                random.choices(UV_INDEX_RANGE, k=24),
+            )
+        ]
 
     def _calculate_feels_like(
         self, temperature: int, wind_speed: int, humidity: int
@@ -258,11 +383,11 @@ class DummyWeatherAPI:
         base_data = {
             "base_temp": random.randint(*pattern["temp_range"]),
             "base_humidity": random.randint(*pattern["humidity_range"]),
-            "dominant_condition": self.select_weather_condition(pattern["conditions"]),
+            "dominant_condition": sample_condition(pattern["condition_table"]),
             "pattern": pattern,
         }
 
-        result = [self._generate_hourly_data(hour, base_data) for hour in range(24)]
+        result = self._generate_hourly_series(base_data)
 
         return {
             "result": result,
@@ -280,16 +405,15 @@ class DummyWeatherAPI:
 
         This method simulates real external API behavior including:
         - Rate limiting (100 requests per hour)
-        - Network delays
-        - Occasional failures
+        - Network delays (`dummy_api_delay_min`..`dummy_api_delay_max`)
+        - Occasional failures (`dummy_api_error_rate`)
         """
         return await self._fetch_weather_wrapped(city)
 
     async def _fetch_weather_impl(self, city: str) -> Dict[str, Any]:
         """Internal implementation of fetch_weather."""
         if not self.rate_limiter.can_make_request():
-            remaining_time = self.rate_limiter.get_reset_time() - datetime.now(UTC)
-            remaining_seconds = int(remaining_time.total_seconds())
+            remaining_seconds = int(self.rate_limiter.get_seconds_until_reset())
 
             raise ValueError(
                 f"Rate limit exceeded. 100 requests per hour limit reached. "
@@ -298,9 +422,16 @@ class DummyWeatherAPI:
 
         self.rate_limiter.record_request()
 
-        await asyncio.sleep(random.uniform(0.1, 0.3))
+        if settings.dummy_api_delay_max > 0:
+            await asyncio.sleep(
+                random.uniform(
+                    settings.dummy_api_delay_min, settings.dummy_api_delay_max
+                )
+            )
 
-        if random.random() < 0.05:
+        if settings.dummy_api_error_rate > 0 and (
+            random.random() < settings.dummy_api_error_rate
+        ):
             raise ValueError("Dummy API simulated server error")
 
         return self.generate_mock_weather_data(city)
@@ -308,19 +439,50 @@ class DummyWeatherAPI:
     def get_rate_limit_info(self) -> Dict[str, Any]:
         """
         Get current rate limit information.
+
+        The keys of the old fixed-window payload are kept with token bucket
+        equivalents: `requests_made` counts the requests still held against
+        the limit (tokens not yet refilled), `window_start` is when the first
+        of those requests was made (None while the bucket is full) and
+        `window_reset` is when the next request will be allowed.
         """
+        snapshot = self.rate_limiter.snapshot()
+        requests_per_hour = self.rate_limiter.requests_per_hour
+        now = datetime.now(UTC)
+        window_start: Optional[datetime] = None
+        if snapshot.window_age is not None:
+            window_start = now - timedelta(seconds=snapshot.window_age)
+        reset_time = now + timedelta(seconds=snapshot.seconds_until_reset)
+
         return {
-            "requests_per_hour": self.rate_limiter.requests_per_hour,
-            "requests_made": self.rate_limiter.request_count,
-            "requests_remaining": self.rate_limiter.get_remaining_requests(),
-            "window_start": (
-                self.rate_limiter.window_start.isoformat()
-                if self.rate_limiter.window_start
-                else None
-            ),
-            "window_reset": self.rate_limiter.get_reset_time().isoformat(),
-            "can_make_request": self.rate_limiter.can_make_request(),
+            "requests_per_hour": requests_per_hour,
+            "requests_made": requests_per_hour - snapshot.remaining,
+            "requests_remaining": snapshot.remaining,
+            "window_start": window_start.isoformat() if window_start else None,
+            "window_reset": reset_time.isoformat(),
+            "can_make_request": snapshot.can_make_request,
         }
 
 
+@lru_cache(maxsize=512)
+def _resolve_pattern(city_lower: str) -> Dict[str, Any]:
+    """
+    Find the weather pattern whose city name occurs in `city_lower`.
+
+    The patterns never change, so each city's substring scan runs once.
+    """
+    for pattern_city, pattern in DummyWeatherAPI.CITY_WEATHER_PATTERNS.items():
+        if pattern_city in city_lower:
+            return pattern
+
+    return DummyWeatherAPI.CITY_WEATHER_PATTERNS["default"]
+
+
+# Build sampling tables once rather than re-summing the weights on every draw
+for _pattern in DummyWeatherAPI.CITY_WEATHER_PATTERNS.values():
+    _pattern["condition_table"] = build_condition_table(_pattern["conditions"])
+    _pattern["hourly_condition_tables"] = build_hourly_condition_tables(
+        _pattern["conditions"]
+    )
+
 dummy_weather_api = DummyWeatherAPI()
@@ -2,7 +2,7 @@
 Priority queue service for background job processing.
 """
 
-from typing import Optional
+from typing import Iterable, List, Optional, Tuple
 
 import redis.asyncio as redis
 
@@ -45,6 +45,30 @@ class QueueService:
             },
         )
 
+    @redis_retry(use_fallback=False)
+    async def add_many_to_queue(self, items: Iterable[Tuple[str, int]]) -> int:
+        """
+        Add several cities to the processing queue in one round-trip.
+
+        All members go into a single multi-member `ZADD` rather than one
+        command per city. Returns the number of cities queued.
+        """
+        queue_key = "weather:queue:cities"
+        mapping = {city.lower(): -priority for city, priority in items}
+        if not mapping:
+            return 0
+
+        await self.redis_client.zadd(queue_key, mapping)
+        logger.info(
+            "Added cities to queue",
+            extra={
+                "event": "queue_add_many",
+                "count": len(mapping),
+                "queue_key": "weather:queue:cities",
+            },
+        )
+        return len(mapping)
+
     @redis_retry(use_fallback=False)
     async def get_from_queue(self) -> Optional[str]:
         """
@@ -58,6 +82,20 @@ class QueueService:
             return city.decode() if isinstance(city, bytes) else city
         return None
 
+    @redis_retry(use_fallback=False)
+    async def get_many_from_queue(self, count: int) -> List[str]:
+        """
+        Pop up to `count` cities from the queue (highest priority first).
+
+        A single `ZPOPMIN` with a count replaces repeated single pops.
+        """
+        queue_key = "weather:queue:cities"
+        result = await self.redis_client.zpopmin(queue_key, count)
+
+        return [
+            city.decode() if isinstance(city, bytes) else city for city, _ in result
+        ]
+
     @redis_retry(use_fallback=False)
     async def get_queue_size(self) -> int:
         """
@@ -2,10 +2,11 @@
 Rate limiting service using Redis with atomic operations.
 """
 
+import logging
+from os import urandom
+from typing import Tuple
+
 import redis.asyncio as redis
-from limits.storage import RedisStorage
-from limits.strategies import MovingWindowRateLimiter
-from limits.util import parse_many
 
 from app.config import get_settings
 from app.utils.logger import setup_logger
@@ -13,51 +14,86 @@ from app.utils.logger import setup_logger
 logger = setup_logger(__name__)
 settings = get_settings()
 
+RATE_LIMIT_STR = (
+    f"{settings.rate_limit_requests} per {settings.rate_limit_window} seconds"
+)
+RATE_LIMIT_KEY_PREFIX = "rate_limit:"
+RATE_LIMIT_WINDOW_MS = settings.rate_limit_window * 1000
+
+# Sliding window log over a sorted set of request timestamps. Prunes
+# entries older than the window, grants up to ARGV[3] tokens and returns
+# {granted, remaining}. Uses the Redis server clock so every app instance
+# shares one time source.
+SLIDING_WINDOW_SCRIPT = """
+local time = redis.call('TIME')
+local now = time[1] * 1000 + math.floor(time[2] / 1000)
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+local used = redis.call('ZCARD', KEYS[1])
+local granted = math.max(0, math.min(requested, limit - used))
+
+for i = 1, granted do
+    redis.call('ZADD', KEYS[1], now, ARGV[4] .. ':' .. i)
+end
+if granted > 0 then
+    redis.call('PEXPIRE', KEYS[1], window)
+end
+
+return {granted, math.max(0, limit - used - granted)}
+"""
+
 
 class RateLimitService:
     """
     Service responsible for distributed rate limiting using Redis with atomic operations.
 
-    Uses the 'limits' library which provides thread-safe, atomic operations
-    and supports moving window rate limiting for better request distribution.
+    Implements a sliding window log in a single Lua script, so each check
+    prunes expired entries, counts usage and records new requests in one
+    atomic round trip on the shared async Redis client.
     """
 
-    def __init__(self, redis_client: redis.Redis = None):
+    def __init__(self, redis_client: redis.Redis):
         """
         Initialize rate limit service with Redis backend.
         """
+        self.redis_client = redis_client
+        self.sliding_window = redis_client.register_script(SLIDING_WINDOW_SCRIPT)
 
-        self.storage = RedisStorage(settings.redis_url)
+        self.rate_limit_str = RATE_LIMIT_STR
+        self.limit = settings.rate_limit_requests
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Initialized rate limiter",
+                extra={
+                    "event": "rate_limiter_init",
+                    "limit": self.rate_limit_str,
+                    "window_seconds": settings.rate_limit_window,
+                },
+            )
 
-        self.limiter = MovingWindowRateLimiter(self.storage)
+    async def _acquire(self, count: int, identifier: str) -> Tuple[int, int]:
+        """
+        Atomically reserve up to `count` tokens.
 
-        self.rate_limit_str = (
-            f"{settings.rate_limit_requests} per {settings.rate_limit_window} seconds"
-        )
-        self.rate_limits = parse_many(self.rate_limit_str)
-
-        window_seconds = settings.rate_limit_window
-        logger.info(
-            "Initialized rate limiter",
-            extra={
-                "event": "rate_limiter_init",
-                "limit": self.rate_limit_str,
-                "window_seconds": window_seconds,
-            },
+        Returns:
+            Tuple of (granted, remaining) token counts
+        """
+        granted, remaining = await self.sliding_window(
+            keys=[f"{RATE_LIMIT_KEY_PREFIX}{identifier}"],
+            args=[RATE_LIMIT_WINDOW_MS, self.limit, count, urandom(8).hex()],
         )
+        return int(granted), int(remaining)
 
     async def get_rate_limit_remaining(self, identifier: str = "global") -> int:
         """
         Get remaining rate limit tokens for the given identifier.
         """
         try:
-
-            rate_limit = self.rate_limits[0]
-
-            _, current_usage = self.limiter.get_window_stats(rate_limit, identifier)
-
-            remaining = max(0, rate_limit.amount - current_usage)
-
+            _, remaining = await self._acquire(0, identifier)
             return remaining
 
         except Exception as e:
@@ -77,25 +113,29 @@ class RateLimitService:
         Consume a rate limit token for the given identifier.
 
         This method is atomic and thread-safe, eliminating race conditions.
+        It never waits for tokens to refill and holds no local lock, so
+        concurrent callers (user requests and the cache warmer) proceed in
+        parallel and a denied caller simply moves on.
         """
         try:
-
-            for rate_limit in self.rate_limits:
-                if not self.limiter.hit(rate_limit, identifier):
-                    logger.warning(
-                        "Rate limit exceeded",
-                        extra={
-                            "event": "rate_limit_exceeded",
-                            "identifier": identifier,
-                            "limit": str(rate_limit),
-                        },
-                    )
-                    return False
-
-            logger.debug(
-                "Rate limit token consumed",
-                extra={"event": "rate_limit_consumed", "identifier": identifier},
-            )
+            granted, _ = await self._acquire(1, identifier)
+
+            if not granted:
+                logger.warning(
+                    "Rate limit exceeded",
+                    extra={
+                        "event": "rate_limit_exceeded",
+                        "identifier": identifier,
+                        "limit": self.rate_limit_str,
+                    },
+                )
+                return False
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Rate limit token consumed",
+                    extra={"event": "rate_limit_consumed", "identifier": identifier},
+                )
             return True
 
         except Exception as e:
@@ -110,3 +150,43 @@ class RateLimitService:
             )
 
             return False
+
+    async def try_consume_many(self, count: int, identifier: str = "global") -> int:
+        """
+        Consume up to `count` rate limit tokens at once.
+
+        Reserves `min(count, remaining)` tokens in the same atomic script
+        call used for single tokens, instead of one round trip per token.
+        Never waits for tokens.
+
+        Returns:
+            Number of tokens granted (0 if none are available or on error)
+        """
+        if count <= 0:
+            return 0
+
+        try:
+            granted, _ = await self._acquire(count, identifier)
+        except Exception as e:
+            logger.error(
+                "Error consuming rate limit tokens",
+                extra={
+                    "event": "rate_limit_error",
+                    "operation": "consume_many",
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                },
+            )
+            return 0
+
+        if granted < count:
+            logger.warning(
+                "Rate limit partially granted",
+                extra={
+                    "event": "rate_limit_partial",
+                    "identifier": identifier,
+                    "requested": count,
+                    "granted": granted,
+                },
+            )
+        return granted
@@ -6,16 +6,40 @@ from typing import List
 
 import redis.asyncio as redis
 
+from app.config import get_settings
 from app.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
+settings = get_settings()
+
+TOP_CITIES_KEY = "top_cities"
+TOP_CITIES_TTL = 86400 * 7
+
+# Space-Saving heavy-hitter update over a sorted set capped at ARGV[2] members.
+# A city that is tracked, or fits, is incremented; otherwise the least counted
+# city is evicted and the newcomer inherits its count plus one. The 7-day TTL
+# is only set when the key has none. KEYS: set key. ARGV: city, capacity, TTL.
+RECORD_CITY_SCRIPT = """
+if redis.call('ZSCORE', KEYS[1], ARGV[1])
+    or redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[2]) then
+    redis.call('ZINCRBY', KEYS[1], 1, ARGV[1])
+else
+    local evicted = redis.call('ZPOPMIN', KEYS[1])
+    redis.call('ZADD', KEYS[1], tonumber(evicted[2]) + 1, ARGV[1])
+end
+redis.call('EXPIRE', KEYS[1], ARGV[3], 'NX')
+return 1
+"""
 
 
 class RequestStatsService:
     """
     Service responsible for tracking request statistics.
 
-    Uses Redis sorted sets for efficient top cities queries.
+    Uses Redis sorted sets for efficient top cities queries. The set is
+    bounded to `top_cities_capacity` members with the Space-Saving
+    algorithm, so memory stays constant however many distinct cities are
+    requested while the most requested ones are still ranked reliably.
     """
 
     def __init__(self, redis_client: redis.Redis):
@@ -23,27 +47,21 @@ class RequestStatsService:
         Initialize request stats service.
         """
         self.redis_client = redis_client
-
-    def _get_stats_key(self, city: str) -> str:
-        """
-        Generate cache key for request statistics.
-        """
-        return f"weather:stats:{city.lower()}:request_count"
+        self.record_city = redis_client.register_script(RECORD_CITY_SCRIPT)
 
     async def increment_stats(self, city: str):
         """
         Increment request statistics for a city.
 
-        Uses both individual counters and sorted set for efficiency.
+        Counts live in a single bounded sorted set that also serves top-cities
+        and per-city lookups. The update, including eviction and the 7-day
+        TTL, runs atomically in one Lua script round-trip.
         """
         try:
-
-            stats_key = self._get_stats_key(city)
-            await self.redis_client.incr(stats_key)
-            await self.redis_client.expire(stats_key, 86400 * 7)
-
-            await self.redis_client.zincrby("top_cities", 1, city.lower())
-            await self.redis_client.expire("top_cities", 86400 * 7)
+            await self.record_city(
+                keys=[TOP_CITIES_KEY],
+                args=[city.lower(), settings.top_cities_capacity, TOP_CITIES_TTL],
+            )
 
         except redis.ConnectionError:
             logger.error(
@@ -79,12 +97,14 @@ class RequestStatsService:
         """
         Get top cities by request count using Redis sorted sets.
 
-        Much more efficient than scanning all keys.
+        Much more efficient than scanning all keys. `count` is capped at the
+        set's capacity, which bounds the reply size.
         """
         try:
+            count = min(count, settings.top_cities_capacity)
 
-            result = await self.redis_client.zrevrange(
-                "top_cities", 0, count - 1, withscores=True
+            result = await self.redis_client.zrange(
+                TOP_CITIES_KEY, 0, count - 1, desc=True, withscores=True
             )
 
             return [
@@ -120,7 +140,7 @@ class RequestStatsService:
         Get request count for a specific city.
         """
         try:
-            score = await self.redis_client.zscore("top_cities", city.lower())
+            score = await self.redis_client.zscore(TOP_CITIES_KEY, city.lower())
             return int(score) if score else 0
 
         except redis.ConnectionError:
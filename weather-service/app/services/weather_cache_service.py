@@ -2,19 +2,46 @@
 Weather-specific caching service.
 """
 
-import json
+import asyncio
+import logging
 from datetime import datetime, UTC
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple, Union
 
+import orjson
 import redis.asyncio as redis
+from cachetools import TTLCache
 
 from app.config import get_settings
+from app.definitions.data_sources import ApiVersion
 from app.utils.logger import setup_logger
 from app.utils.resilience import redis_retry, with_fallback, fallback_cache
 
 logger = setup_logger(__name__)
 settings = get_settings()
 
+REDIS_CACHE_TTL = settings.redis_cache_ttl
+REDIS_STALE_TTL = settings.redis_stale_ttl
+REDIS_RESPONSE_TTL = settings.redis_response_ttl
+RESPONSE_VERSIONS = tuple(version.value for version in ApiVersion)
+
+# Return the stale copy, or promote the primary entry to stale, in one round
+# trip. KEYS: stale key, primary key. ARGV: stale TTL in seconds.
+STALE_LOOKUP_SCRIPT = """
+local data = redis.call('GET', KEYS[1])
+if data then
+    return data
+end
+data = redis.call('GET', KEYS[2])
+if data then
+    redis.call('SET', KEYS[1], data, 'EX', ARGV[1])
+end
+return data
+"""
+
+local_response_cache: TTLCache = TTLCache(
+    maxsize=settings.local_cache_max_size, ttl=settings.local_cache_ttl
+)
+
 
 class WeatherCacheService:
     """
@@ -28,6 +55,7 @@ class WeatherCacheService:
         Initialize weather cache service.
         """
         self.redis_client = redis_client
+        self.stale_lookup = redis_client.register_script(STALE_LOOKUP_SCRIPT)
 
     def _get_weather_key(self, city: str, date: str) -> str:
         """
@@ -35,6 +63,12 @@ class WeatherCacheService:
         """
         return f"weather:{city.lower()}:{date}"
 
+    def _get_response_key(self, city: str, date: str, version: str) -> str:
+        """
+        Generate cache key for a serialized API response.
+        """
+        return f"weather:response:{version}:{city.lower()}:{date}"
+
     def _get_meta_key(self, city: str) -> str:
         """
         Generate cache key for metadata.
@@ -62,8 +96,8 @@ class WeatherCacheService:
         cached_json = fallback_cache.get(key)
         if cached_json:
             try:
-                return json.loads(cached_json)
-            except json.JSONDecodeError:
+                return orjson.loads(cached_json)
+            except orjson.JSONDecodeError:
                 return None
         return None
 
@@ -98,10 +132,10 @@ class WeatherCacheService:
             data = await self.redis_client.get(key)
 
             if data:
-                return json.loads(data)
+                return orjson.loads(data)
             return None
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(
                 "Invalid JSON in cache",
                 extra={
@@ -151,8 +185,8 @@ class WeatherCacheService:
             ttl_seconds: Time-to-live in seconds (uses default if not specified)
         """
         key = self._get_weather_key(city, date)
-        ttl = ttl_seconds or settings.redis_cache_ttl
-        fallback_cache.set(key, json.dumps(weather_data), ttl_seconds=ttl)
+        ttl = ttl_seconds or REDIS_CACHE_TTL
+        fallback_cache.set(key, orjson.dumps(weather_data), ttl_seconds=ttl)
         logger.info(
             "Stored weather data in fallback cache",
             extra={"city": city, "event": "fallback_cache_set", "key": key, "ttl": ttl},
@@ -174,8 +208,9 @@ class WeatherCacheService:
         1. Serializes weather data to JSON format
         2. Stores data in Redis with specified TTL
         3. Updates metadata key with last update timestamp
-        4. If Redis fails, retries with exponential backoff
-        5. Falls back to in-memory storage only if Redis is completely unavailable
+        4. Drops the serialized responses built from the previous data
+        5. If Redis fails, retries with exponential backoff
+        6. Falls back to in-memory storage only if Redis is completely unavailable
 
         This method prioritizes Redis storage for high-performance caching.
         The fallback is used only during complete Redis outages to maintain
@@ -188,30 +223,181 @@ class WeatherCacheService:
             ttl_seconds: Optional TTL in seconds (defaults to config value)
 
         Note:
-            Both the weather data and metadata are stored atomically when possible.
-            The metadata key has a longer TTL for stale data scenarios.
+            The weather data and metadata writes and the response cache
+            invalidation are pipelined into a single round-trip. The metadata
+            key has a longer TTL for stale data scenarios. Other processes may
+            serve their local copy of an old response for up to
+            `local_cache_ttl` seconds.
         """
         key = self._get_weather_key(city, date)
-        ttl = ttl_seconds or settings.redis_cache_ttl
-        data_json = json.dumps(weather_data)
-
-        await self.redis_client.setex(key, ttl, data_json)
+        ttl = ttl_seconds or REDIS_CACHE_TTL
+        data_json = orjson.dumps(weather_data)
 
         meta_key = self._get_meta_key(city)
-        await self.redis_client.setex(
-            meta_key, settings.redis_stale_ttl, datetime.now(UTC).isoformat()
-        )
+        response_keys = [
+            self._get_response_key(city, date, version) for version in RESPONSE_VERSIONS
+        ]
+
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.setex(key, ttl, data_json)
+        pipe.setex(meta_key, REDIS_STALE_TTL, datetime.now(UTC).isoformat())
+        pipe.delete(*response_keys)
+        await pipe.execute()
+
+        for response_key in response_keys:
+            local_response_cache.pop(response_key, None)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Cached weather data",
+                extra={
+                    "city": city,
+                    "event": "cache_set",
+                    "ttl_seconds": ttl,
+                    "date": date,
+                    "has_metadata": True,
+                },
+            )
 
-        logger.info(
-            "Cached weather data",
-            extra={
-                "city": city,
-                "event": "cache_set",
-                "ttl_seconds": ttl,
-                "date": date,
-                "has_metadata": True,
-            },
-        )
+    async def get_many(
+        self, cities: List[str], date: str
+    ) -> List[Tuple[Optional[Dict[str, Any]], Optional[int]]]:
+        """
+        Retrieve weather data and remaining TTLs for several cities at once.
+
+        One pipelined round-trip sends an `MGET` for all keys plus a `TTL`
+        per key, instead of one `GET` per city. If the batch call fails, the
+        cities are looked up with concurrent `get_weather` calls instead, so
+        the retry and in-memory fallback still apply; TTLs are then unknown
+        and any lookup that still fails is reported as a miss.
+
+        Args:
+            cities: City names to retrieve weather for
+            date: Date in ISO format (YYYY-MM-DD)
+
+        Returns:
+            (weather data or None, remaining TTL in seconds or None) for each
+            city, in input order
+        """
+        if not cities:
+            return []
+
+        keys = [self._get_weather_key(city, date) for city in cities]
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.mget(keys)
+            for key in keys:
+                pipe.ttl(key)
+            values, *ttls = await pipe.execute()
+        except Exception as e:
+            logger.warning(
+                "Failed to get cached weather batch",
+                extra={
+                    "event": "cache_mget_error",
+                    "city_count": len(cities),
+                    "error": str(e),
+                },
+            )
+            results = await asyncio.gather(
+                *(self.get_weather(city, date) for city in cities),
+                return_exceptions=True,
+            )
+            return [
+                (None if isinstance(r, BaseException) else r, None) for r in results
+            ]
+
+        entries: List[Tuple[Optional[Dict[str, Any]], Optional[int]]] = []
+        for value, ttl in zip(values, ttls):
+            try:
+                data = orjson.loads(value) if value else None
+            except orjson.JSONDecodeError:
+                data = None
+            entries.append((data, ttl if data is not None else None))
+        return entries
+
+    async def get_response(
+        self, city: str, date: str, version: str
+    ) -> Optional[Union[str, bytes]]:
+        """
+        Retrieve a pre-serialized API response for a city.
+
+        A hit lets the API layer return the stored JSON as-is, skipping model
+        construction and serialization. Lookups check the in-process
+        `local_response_cache` first and only go to Redis on a local miss;
+        Redis hits are copied into the local tier. Failures are treated as a
+        miss so the regular cache path (with retry and fallback) can take over.
+
+        Args:
+            city: City name to retrieve the response for
+            date: Date in ISO format (YYYY-MM-DD)
+            version: API version value (e.g. "v1", "v2")
+
+        Returns:
+            Serialized JSON response if cached, None otherwise
+        """
+        key = self._get_response_key(city, date, version)
+        payload = local_response_cache.get(key)
+        if payload is not None:
+            return payload
+
+        try:
+            payload = await self.redis_client.get(key)
+        except Exception as e:
+            logger.warning(
+                "Failed to get cached response",
+                extra={
+                    "city": city,
+                    "event": "response_cache_get_error",
+                    "api_version": version,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                },
+            )
+            return None
+
+        if payload:
+            local_response_cache[key] = payload
+        return payload
+
+    async def set_response(
+        self,
+        city: str,
+        date: str,
+        version: str,
+        payload: bytes,
+        ttl_seconds: Optional[int] = None,
+    ):
+        """
+        Store a pre-serialized API response for a city.
+
+        The payload is written to both the in-process cache and Redis. The
+        Redis TTL is kept short (see `redis_response_ttl`) so a cached
+        response never outlives the underlying weather data by much.
+
+        Args:
+            city: City name for the response
+            date: Date in ISO format (YYYY-MM-DD)
+            version: API version value (e.g. "v1", "v2")
+            payload: Serialized JSON response
+            ttl_seconds: Optional TTL in seconds (defaults to config value)
+        """
+        key = self._get_response_key(city, date, version)
+        local_response_cache[key] = payload
+        try:
+            await self.redis_client.setex(
+                key, ttl_seconds or REDIS_RESPONSE_TTL, payload
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to cache response",
+                extra={
+                    "city": city,
+                    "event": "response_cache_set_error",
+                    "api_version": version,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                },
+            )
 
     async def _get_stale_weather_fallback(
         self, city: str, date: str
@@ -239,8 +425,8 @@ class WeatherCacheService:
             cached_json = fallback_cache.get(key)
             if cached_json:
                 try:
-                    return json.loads(cached_json)
-                except json.JSONDecodeError:
+                    return orjson.loads(cached_json)
+                except orjson.JSONDecodeError:
                     continue
         return None
 
@@ -257,6 +443,7 @@ class WeatherCacheService:
         Behavior:
         1. First checks for data explicitly marked as stale (with :stale suffix)
         2. If not found, checks regular cache keys and promotes them to stale
+           (both steps run server-side in one Lua script, so one round trip)
         3. Implements full retry logic for Redis failures
         4. Falls back to in-memory cache during Redis outages
 
@@ -279,18 +466,15 @@ class WeatherCacheService:
             key = self._get_weather_key(city, date)
             stale_key = f"{key}:stale"
 
-            data = await self.redis_client.get(stale_key)
-            if data:
-                return json.loads(data)
-
-            data = await self.redis_client.get(key)
+            data = await self.stale_lookup(
+                keys=[stale_key, key], args=[REDIS_STALE_TTL]
+            )
             if data:
-                await self.redis_client.setex(stale_key, settings.redis_stale_ttl, data)
-                return json.loads(data)
+                return orjson.loads(data)
 
             return None
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(
                 "Invalid JSON in stale cache",
                 extra={
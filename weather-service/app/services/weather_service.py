@@ -2,13 +2,15 @@
 This module provides weather-related services.
 """
 
+import asyncio
+import logging
 from datetime import datetime, date, UTC
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Dict
 
 from app.config import get_settings
 from app.definitions.data_sources import ApiVersion
-from app.schemas.api_v1 import WeatherResponse, HourlyWeather
-from app.schemas.api_v2 import WeatherResponseV2, WeatherMetadata, HourlyWeatherV2
+from app.schemas.api_v1 import WeatherResponse, weather_response_adapter
+from app.schemas.api_v2 import WeatherResponseV2, weather_response_v2_adapter
 from app.services.dummy_external_api import dummy_weather_api
 from app.services.queue_service import QueueService
 from app.services.rate_limit_service import RateLimitService
@@ -19,6 +21,8 @@ from app.utils.logger import setup_logger
 logger = setup_logger(__name__)
 settings = get_settings()
 
+_inflight_fetches: Dict[str, asyncio.Future] = {}
+
 
 class WeatherService:
     """
@@ -44,18 +48,80 @@ class WeatherService:
     def _strip_temperature_units(weather_data: List[dict]) -> List[dict]:
         """
         Strip temperature units (°C) from weather data.
+
+        Built as a single comprehension; rows without a string temperature
+        are passed through as-is since they are never mutated downstream.
+        The unit is always a suffix, so `removesuffix` drops it without
+        scanning the whole string as `replace` does.
+        """
+        return [
+            (
+                {
+                    **hour_data,
+                    "temperature": hour_data["temperature"].removesuffix("°C").strip(),
+                }
+                if isinstance(hour_data.get("temperature"), str)
+                else hour_data
+            )
+            for hour_data in weather_data
+        ]
+
+    async def get_cached_response(
+        self, city: str, version: ApiVersion = ApiVersion.V1
+    ) -> Optional[Union[str, bytes]]:
         """
-        cleaned_data = []
-        for hour_data in weather_data:
-            cleaned_hour = hour_data.copy()
-            if "temperature" in cleaned_hour and isinstance(
-                cleaned_hour["temperature"], str
-            ):
-                cleaned_hour["temperature"] = (
-                    cleaned_hour["temperature"].replace("°C", "").strip()
+        Get a pre-serialized response for a city, if one is cached.
+
+        A hit is counted towards the request statistics, just like a regular
+        cache hit in `get_weather`.
+        """
+        today_date = date.today().isoformat()
+
+        payload = await self.weather_cache.get_response(city, today_date, version.value)
+        if payload:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Cache hit",
+                    extra={
+                        "city": city,
+                        "event": "cache_hit",
+                        "source": "redis_response",
+                        "date": today_date,
+                        "api_version": version.value,
+                    },
                 )
-            cleaned_data.append(cleaned_hour)
-        return cleaned_data
+            await self.stats_tracker.increment_stats(city)
+            return payload
+        return None
+
+    async def _cache_response(
+        self,
+        city: str,
+        date_str: str,
+        version: ApiVersion,
+        response: Union[WeatherResponse, WeatherResponseV2],
+    ) -> None:
+        """
+        Store the serialized form of a fresh response for later cache hits.
+
+        Serialization matches the API layer byte-for-byte: both versions go
+        through their precompiled `TypeAdapter`. Every later request served
+        from the stored bytes is a cache hit, so a v2 response is stored with
+        `source="cache"`; `last_updated` keeps the time the data was built.
+        """
+        if version == ApiVersion.V2:
+            if response.metadata.source != "cache":
+                response = response.model_copy(
+                    update={
+                        "metadata": response.metadata.model_copy(
+                            update={"source": "cache"}
+                        )
+                    }
+                )
+            payload = weather_response_v2_adapter.dump_json(response)
+        else:
+            payload = weather_response_adapter.dump_json(response)
+        await self.weather_cache.set_response(city, date_str, version.value, payload)
 
     async def get_weather(
         self, city: str, version: ApiVersion = ApiVersion.V1
@@ -67,17 +133,18 @@ class WeatherService:
 
         cached_data = await self.weather_cache.get_weather(city, today_date)
         if cached_data:
-            logger.info(
-                "Cache hit",
-                extra={
-                    "city": city,
-                    "event": "cache_hit",
-                    "source": "redis",
-                    "date": today_date,
-                },
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Cache hit",
+                    extra={
+                        "city": city,
+                        "event": "cache_hit",
+                        "source": "redis",
+                        "date": today_date,
+                    },
+                )
             await self.stats_tracker.increment_stats(city)
-            return self._build_response(
+            response = self._build_response(
                 city=city,
                 date_str=today_date,
                 weather_data=cached_data["weather"],
@@ -85,44 +152,27 @@ class WeatherService:
                 freshness="fresh",
                 version=version,
             )
+            await self._cache_response(city, today_date, version, response)
+            return response
 
-        logger.info(
-            "Cache miss",
-            extra={"city": city, "event": "cache_miss", "date": today_date},
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Cache miss",
+                extra={"city": city, "event": "cache_miss", "date": today_date},
+            )
 
-        if await self.rate_limiter.consume_rate_limit_token():
-            try:
-                logger.info(
-                    "Fetching weather from external API",
-                    extra={"city": city, "event": "api_call", "api": "weather"},
-                )
-                external_data = await dummy_weather_api.fetch_weather(city)
-
-                if external_data:
-                    cache_data = {"weather": external_data["result"]}
-                    await self.weather_cache.set_weather(
-                        city=city, date=today_date, weather_data=cache_data
-                    )
-
-                    return self._build_response(
-                        city=city,
-                        date_str=today_date,
-                        weather_data=external_data["result"],
-                        source="api",
-                        freshness="fresh",
-                        version=version,
-                    )
-            except Exception as e:
-                logger.error(
-                    "Failed to fetch weather from external API",
-                    extra={
-                        "city": city,
-                        "event": "api_error",
-                        "error": str(e),
-                        "error_type": type(e).__name__,
-                    },
-                )
+        fresh_weather = await self._fetch_fresh_weather(city, today_date)
+        if fresh_weather is not None:
+            response = self._build_response(
+                city=city,
+                date_str=today_date,
+                weather_data=fresh_weather,
+                source="api",
+                freshness="fresh",
+                version=version,
+            )
+            await self._cache_response(city, today_date, version, response)
+            return response
 
         logger.warning(
             "Rate limited or API failed, checking for stale data",
@@ -167,6 +217,105 @@ class WeatherService:
             version=version,
         )
 
+    async def refresh_weather(self, city: str) -> bool:
+        """
+        Fetch fresh weather for a city into the cache, bypassing cached data.
+
+        Used by the cache warmer, which reserves the rate limit token for the
+        fetch up front, so none is consumed here. Request statistics are left
+        untouched so warming never inflates the counts it ranks cities by.
+
+        Returns:
+            True if fresh data was fetched and cached, False otherwise
+        """
+        today_date = date.today().isoformat()
+        fresh_weather = await self._fetch_fresh_weather(
+            city, today_date, token_reserved=True
+        )
+        return fresh_weather is not None
+
+    async def _fetch_fresh_weather(
+        self, city: str, today_date: str, token_reserved: bool = False
+    ) -> Optional[List[dict]]:
+        """
+        Fetch fresh weather from the external API, coalescing concurrent calls.
+
+        Concurrent cache misses for the same city share a single in-flight
+        fetch (single-flight), so a cold-cache burst consumes one rate limit
+        token and makes one external API call instead of one per request.
+        Followers await the leader's result through `asyncio.shield`, so a
+        cancelled follower never cancels the shared fetch. If the leader's
+        fetch raises, followers get the same exception; only a cancelled
+        leader sends them down the stale data path with no result.
+
+        Returns:
+            Hourly weather rows, or None if rate limited or the API failed
+        """
+        key = f"{city.lower()}:{today_date}"
+        inflight = _inflight_fetches.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        _inflight_fetches[key] = future
+        try:
+            result = await self._fetch_and_cache_weather(
+                city, today_date, token_reserved
+            )
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception retrieved so a fetch without followers
+            # does not log "exception was never retrieved".
+            future.exception()
+            raise
+        except BaseException:
+            future.set_result(None)
+            raise
+        finally:
+            del _inflight_fetches[key]
+
+    async def _fetch_and_cache_weather(
+        self, city: str, today_date: str, token_reserved: bool = False
+    ) -> Optional[List[dict]]:
+        """
+        Consume a rate limit token, fetch weather and store it in the cache.
+
+        The token is skipped when the caller has already reserved one.
+        """
+        if (
+            not token_reserved
+            and not await self.rate_limiter.consume_rate_limit_token()
+        ):
+            return None
+
+        try:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Fetching weather from external API",
+                    extra={"city": city, "event": "api_call", "api": "weather"},
+                )
+            external_data = await dummy_weather_api.fetch_weather(city)
+
+            if external_data:
+                cache_data = {"weather": external_data["result"]}
+                await self.weather_cache.set_weather(
+                    city=city, date=today_date, weather_data=cache_data
+                )
+                return external_data["result"]
+        except Exception as e:
+            logger.error(
+                "Failed to fetch weather from external API",
+                extra={
+                    "city": city,
+                    "event": "api_error",
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                },
+            )
+        return None
+
     def _build_response(
         self,
         city: str,
@@ -179,22 +328,25 @@ class WeatherService:
     ) -> Union[WeatherResponse, WeatherResponseV2]:
         """
         Build response object from weather data based on API version.
+
+        The hourly rows are validated together with the envelope in a single
+        `model_validate` call rather than one model construction per hour.
         """
         cleaned_data = self._strip_temperature_units(weather_data)
 
         if version == ApiVersion.V1:
-            hourly_weather = [HourlyWeather(**hour_data) for hour_data in cleaned_data]
-            return WeatherResponse(weather=hourly_weather)
+            return WeatherResponse.model_validate({"weather": cleaned_data})
 
-        hourly_weather = [HourlyWeatherV2(**hour_data) for hour_data in cleaned_data]
-        metadata = WeatherMetadata(
-            last_updated=datetime.now(UTC), data_freshness=freshness, source=source
-        )
-        warnings = [warning] if warning else []
-        return WeatherResponseV2(
-            city=city,
-            date=date_str,
-            weather=hourly_weather,
-            metadata=metadata,
-            warnings=warnings,
+        return WeatherResponseV2.model_validate(
+            {
+                "city": city,
+                "date": date_str,
+                "weather": cleaned_data,
+                "metadata": {
+                    "last_updated": datetime.now(UTC),
+                    "data_freshness": freshness,
+                    "source": source,
+                },
+                "warnings": [warning] if warning else [],
+            }
         )
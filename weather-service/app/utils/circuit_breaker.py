@@ -3,6 +3,7 @@ Simplified circuit breaker implementation for protecting external service calls.
 """
 
 import asyncio
+import logging
 import time
 from enum import Enum
 from functools import wraps
@@ -55,28 +56,29 @@ class CircuitBreaker:
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt reset."""
         return (
-            self._last_failure_time
-            and time.time() - self._last_failure_time >= self.recovery_timeout
+            self._last_failure_time is not None
+            and time.monotonic() - self._last_failure_time >= self.recovery_timeout
         )
 
     def _record_success(self):
         """Record successful call."""
         self._failure_count = 0
         self._state = CircuitState.CLOSED
-        logger.debug(
-            "Circuit breaker recorded success",
-            extra={
-                "event": "circuit_breaker_success",
-                "circuit_name": self.name,
-                "state": "CLOSED",
-                "failure_count": 0,
-            },
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Circuit breaker recorded success",
+                extra={
+                    "event": "circuit_breaker_success",
+                    "circuit_name": self.name,
+                    "state": "CLOSED",
+                    "failure_count": 0,
+                },
+            )
 
     def _record_failure(self):
         """Record failed call."""
         self._failure_count += 1
-        self._last_failure_time = time.time()
+        self._last_failure_time = time.monotonic()
 
         if self._failure_count >= self.failure_threshold:
             self._state = CircuitState.OPEN
@@ -6,7 +6,7 @@ built-in dependency injection system for better testability and
 reduced coupling compared to global singleton containers.
 """
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Callable, Dict, Tuple
 
 import redis.asyncio as redis
 from fastapi import Depends
@@ -26,6 +26,26 @@ settings = get_settings()
 # Module-level Redis pool instance to be shared across requests
 _redis_pool: ResilientRedisPool | None = None
 
+# Services hold no per-request state, so one instance per set of
+# dependencies is reused across requests instead of being rebuilt each time
+_services: Dict[Callable, Tuple[Tuple, Any]] = {}
+
+
+def _shared_service(factory: Callable, *deps):
+    """
+    Return the cached service built by `factory` from `deps`.
+
+    The instance is rebuilt only when one of its dependencies is no longer
+    the same object, e.g. after the Redis pool has been recreated.
+    """
+    cached = _services.get(factory)
+    if cached is not None and all(a is b for a, b in zip(cached[0], deps)):
+        return cached[1]
+
+    service = factory(*deps)
+    _services[factory] = (deps, service)
+    return service
+
 
 async def get_redis_pool() -> ResilientRedisPool:
     """
@@ -39,7 +59,9 @@ async def get_redis_pool() -> ResilientRedisPool:
     """
     global _redis_pool  # pylint: disable=global-statement
     if _redis_pool is None:
-        _redis_pool = ResilientRedisPool(settings.redis_url)
+        _redis_pool = ResilientRedisPool(
+            settings.redis_url, max_connections=settings.redis_pool_size
+        )
         await _redis_pool.health_check()
         logger.info("Redis connection pool initialized")
     return _redis_pool
@@ -77,7 +99,7 @@ async def get_weather_cache(
     Returns:
         WeatherCacheService: Configured cache service
     """
-    return WeatherCacheService(redis_client)
+    return _shared_service(WeatherCacheService, redis_client)
 
 
 async def get_rate_limiter(
@@ -92,7 +114,7 @@ async def get_rate_limiter(
     Returns:
         RateLimitService: Configured rate limiter
     """
-    return RateLimitService(redis_client)
+    return _shared_service(RateLimitService, redis_client)
 
 
 async def get_stats_tracker(
@@ -107,7 +129,7 @@ async def get_stats_tracker(
     Returns:
         RequestStatsService: Configured stats tracker
     """
-    return RequestStatsService(redis_client)
+    return _shared_service(RequestStatsService, redis_client)
 
 
 async def get_queue_manager(
@@ -122,7 +144,7 @@ async def get_queue_manager(
     Returns:
         QueueService: Configured queue manager
     """
-    return QueueService(redis_client)
+    return _shared_service(QueueService, redis_client)
 
 
 async def get_weather_service(
@@ -146,11 +168,8 @@ async def get_weather_service(
     Returns:
         WeatherService: Fully configured weather service
     """
-    return WeatherService(
-        weather_cache=weather_cache,
-        rate_limiter=rate_limiter,
-        stats_tracker=stats_tracker,
-        queue_manager=queue_manager,
+    return _shared_service(
+        WeatherService, weather_cache, rate_limiter, stats_tracker, queue_manager
     )
 
 
@@ -165,4 +184,5 @@ async def close_redis_pool():
     if _redis_pool:
         await _redis_pool.close()
         _redis_pool = None
+        _services.clear()
         logger.info("Redis connection pool closed")
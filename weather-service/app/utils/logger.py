@@ -2,8 +2,12 @@
 This module provides logging utilities for the application.
 """
 
+import atexit
+import copy
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 from pythonjsonlogger import jsonlogger
 
@@ -11,28 +15,64 @@ from app.config import get_settings
 
 settings = get_settings()
 
+LOG_LEVEL = getattr(logging, settings.log_level.upper())
+
+
+def _create_handler() -> logging.Handler:
+    """
+    Create the stdout handler with JSON formatting shared by all loggers.
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setLevel(LOG_LEVEL)
+    handler.setFormatter(
+        jsonlogger.JsonFormatter(
+            fmt="%(asctime)s %(name)s %(levelname)s %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+    )
+    return handler
+
+
+class _RecordQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves all formatting to the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Resolve the message arguments but keep the exception info, so the JSON
+        formatter still renders tracebacks as a separate `exc_info` field.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Loggers only enqueue records; a listener thread formats them (tracebacks
+# included) and writes to stdout, so the event loop never blocks on log I/O.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+LOG_HANDLER = _RecordQueueHandler(_log_queue)
+_log_listener = QueueListener(_log_queue, _create_handler(), respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 
 def setup_logger(name: str) -> logging.Logger:
     """
     Set up a logger with JSON formatting for structured logging.
+
+    Loggers are configured once; later calls for the same name return the
+    existing logger without adding another handler. All loggers share one
+    queue handler; formatting and writing happen on a background thread.
     """
     logger = logging.getLogger(name)
 
     if logger.handlers:
         return logger
 
-    logger.setLevel(getattr(logging, settings.log_level.upper()))
-
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(getattr(logging, settings.log_level.upper()))
-
-    formatter = jsonlogger.JsonFormatter(
-        fmt="%(asctime)s %(name)s %(levelname)s %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-    handler.setFormatter(formatter)
-
-    logger.addHandler(handler)
+    logger.setLevel(LOG_LEVEL)
+    logger.addHandler(LOG_HANDLER)
     logger.propagate = False
 
     return logger
@@ -263,7 +263,8 @@ class ResilientRedisPool:
 
         Lazily initializes the connection pool on first access. Subsequent
         calls return the same client instance. The pool is configured with
-        TCP keepalive to maintain connection health.
+        TCP keepalive and a periodic health check so idle connections are
+        verified before reuse instead of failing mid-request.
 
         Returns:
             Redis client instance with connection pooling
@@ -273,6 +274,8 @@ class ResilientRedisPool:
                 self.redis_url,
                 max_connections=self.max_connections,
                 decode_responses=settings.redis_decode_responses,
+                socket_keepalive=True,
+                health_check_interval=settings.redis_health_check_interval,
             )
             self._client = redis.Redis(connection_pool=self._pool)
 
@@ -0,0 +1,67 @@
+"""
+Tests for the API version 1 routes.
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.schemas.api_v1 import WeatherResponse, HourlyWeather
+from app.utils.dependencies import get_weather_service
+
+
+@pytest.fixture
+def weather_service():
+    """Create a mocked weather service returning a V1 response."""
+    service = AsyncMock()
+    service.get_cached_response.return_value = None
+    service.get_weather.return_value = WeatherResponse(
+        weather=[HourlyWeather(hour=0, temperature="18", condition="Clear")]
+    )
+    return service
+
+
+@pytest.fixture
+def client(weather_service):
+    """Create a test client with the weather service dependency overridden."""
+    app.dependency_overrides[get_weather_service] = lambda: weather_service
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+class TestWeatherRoutesV1:
+    """Test cases for the V1 weather endpoint."""
+
+    def test_get_weather_v1(self, client):
+        """Test V1 weather payload and deprecation headers."""
+        response = client.get("/v1/weather", params={"city": "London"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["X-API-Deprecation"] == "true"
+        assert "X-Request-ID" in response.headers
+        assert response.json() == {
+            "weather": [{"hour": 0, "temperature": "18", "condition": "Clear"}]
+        }
+
+    def test_get_weather_v1_cached_response(self, client, weather_service):
+        """Test that a cached response is returned without rebuilding it."""
+        weather_service.get_cached_response.return_value = b'{"weather":[]}'
+
+        response = client.get("/v1/weather", params={"city": "London"})
+
+        assert response.status_code == 200
+        assert response.headers["X-API-Deprecation"] == "true"
+        assert response.json() == {"weather": []}
+        weather_service.get_weather.assert_not_called()
+
+    def test_get_weather_v1_error(self, client, weather_service):
+        """Test V1 weather endpoint error handling."""
+        weather_service.get_weather.side_effect = Exception("boom")
+
+        response = client.get("/v1/weather", params={"city": "London"})
+
+        assert response.status_code == 500
+        assert response.json()["detail"]["error"] == "Internal server error"
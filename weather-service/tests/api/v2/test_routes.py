@@ -0,0 +1,158 @@
+"""
+Tests for the API version 2 routes.
+"""
+
+import asyncio
+from datetime import datetime, UTC
+from unittest.mock import AsyncMock
+
+import pytest
+import redis.asyncio as redis
+from fastapi.testclient import TestClient
+
+from app.api.v2 import routes as v2_routes
+from app.main import app
+from app.schemas.api_v2 import (
+    WeatherResponseV2,
+    HourlyWeatherV2,
+    WeatherMetadata,
+    MetricsResponse,
+)
+from app.utils.dependencies import (
+    get_weather_service,
+    get_redis_client,
+    get_stats_tracker,
+    get_rate_limiter,
+)
+
+
+@pytest.fixture
+def weather_service():
+    """Create a mocked weather service returning a V2 response."""
+    service = AsyncMock()
+    service.get_cached_response.return_value = None
+    service.get_weather.return_value = WeatherResponseV2(
+        city="London",
+        date="2025-07-25",
+        weather=[HourlyWeatherV2(hour=0, temperature="18", condition="Clear")],
+        metadata=WeatherMetadata(
+            last_updated=datetime.now(UTC), data_freshness="fresh", source="cache"
+        ),
+    )
+    return service
+
+
+@pytest.fixture
+def client(weather_service):
+    """Create a test client with the weather service dependency overridden."""
+    app.dependency_overrides[get_weather_service] = lambda: weather_service
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+class TestWeatherRoutesV2:
+    """Test cases for the V2 weather endpoints."""
+
+    @pytest.mark.parametrize("path", ["/v2/weather", "/weather"])
+    def test_get_weather_v2(self, client, path):
+        """Test V2 weather payload on versioned and default routes."""
+        response = client.get(path, params={"city": "London"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        body = response.json()
+        assert body["city"] == "London"
+        assert body["weather"][0]["temperature"] == "18"
+        assert body["metadata"]["data_freshness"] == "fresh"
+        assert body["warnings"] == []
+
+    def test_get_weather_v2_cached_response(self, client, weather_service):
+        """Test that a cached response is returned without rebuilding it."""
+        weather_service.get_cached_response.return_value = b'{"city":"London"}'
+
+        response = client.get("/v2/weather", params={"city": "London"})
+
+        assert response.status_code == 200
+        assert response.json() == {"city": "London"}
+        weather_service.get_weather.assert_not_called()
+
+    def test_get_weather_v2_error(self, client, weather_service):
+        """Test V2 weather endpoint error handling."""
+        weather_service.get_weather.side_effect = Exception("boom")
+
+        response = client.get("/v2/weather", params={"city": "London"})
+
+        assert response.status_code == 500
+        assert response.json()["detail"]["error"] == "Internal server error"
+
+
+class TestMonitoringRoutesV2:
+    """Test cases for the V2 health and metrics endpoints."""
+
+    @pytest.fixture
+    def redis_client(self):
+        """Create a mocked Redis client."""
+        return AsyncMock()
+
+    @pytest.fixture
+    def client(self, redis_client):
+        """Create a test client with monitoring dependencies overridden."""
+        stats_tracker = AsyncMock()
+        stats_tracker.get_top_cities.return_value = [("london", 5)]
+        rate_limiter = AsyncMock()
+        rate_limiter.get_rate_limit_remaining.return_value = 42
+
+        v2_routes._health_cache.clear()
+        v2_routes._metrics_cache.clear()
+        app.dependency_overrides[get_redis_client] = lambda: redis_client
+        app.dependency_overrides[get_stats_tracker] = lambda: stats_tracker
+        app.dependency_overrides[get_rate_limiter] = lambda: rate_limiter
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def test_health_check(self, client):
+        """Test health endpoint reports healthy Redis."""
+        response = client.get("/v2/health")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "healthy"
+        assert response.json()["services"]["redis"] == "healthy"
+
+    def test_health_check_is_cached(self, client, redis_client):
+        """Test repeated health probes within the TTL reuse one Redis ping."""
+        client.get("/v2/health")
+        client.get("/health")
+
+        redis_client.ping.assert_called_once()
+
+    def test_health_check_ping_timeout(self, client, redis_client):
+        """Test that a hung Redis ping reports Redis as unhealthy."""
+
+        async def hung_ping():
+            await asyncio.sleep(10)
+
+        redis_client.ping.side_effect = hung_ping
+
+        response = client.get("/v2/health")
+
+        assert response.json()["status"] == "degraded"
+        assert response.json()["services"]["redis"] == "unhealthy"
+
+    def test_health_check_redis_error(self, client, redis_client):
+        """Test that a Redis connection error reports Redis as unhealthy."""
+        redis_client.ping.side_effect = redis.ConnectionError("refused")
+
+        response = client.get("/v2/health")
+
+        assert response.json()["status"] == "degraded"
+        assert response.json()["services"]["redis"] == "unhealthy"
+
+    def test_get_metrics(self, client):
+        """Test metrics endpoint combines top cities and rate limit status."""
+        response = client.get("/v2/metrics")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["rate_limit_remaining"] == 42
+        assert body["top_cities"] == [{"city": "london", "requests": 5}]
+        MetricsResponse.model_validate(body)
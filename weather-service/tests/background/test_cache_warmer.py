@@ -6,15 +6,20 @@ import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from aiolimiter import AsyncLimiter
 
+from app.background import cache_warmer
 from app.background.cache_warmer import (
+    WarmServices,
     warm_single_city,
+    warm_worker,
     get_cities_to_warm,
     warm_cache,
     cache_warmer_task,
+    next_warm_interval,
+    WarmResult,
     start_cache_warmer,
 )
-from app.definitions.data_sources import ApiVersion
 
 
 class TestCacheWarmer:
@@ -28,15 +33,149 @@ class TestCacheWarmer:
     async def test_warm_single_city_success(self):
         """Test successful cache warming for individual city.
 
-        Verifies that the cache warmer correctly calls the weather
-        service to refresh data for a specified city using the V2 API.
+        Verifies that the cache warmer forces a fresh fetch for the city
+        instead of going through the cached read path.
         """
         weather_service = AsyncMock()
-        semaphore = asyncio.Semaphore(1)
 
-        await warm_single_city("London", weather_service, semaphore)
+        result = await warm_single_city("London", weather_service, AsyncLimiter(100, 1))
 
-        weather_service.get_weather.assert_called_once_with("London", ApiVersion.V2)
+        assert result is True
+        weather_service.refresh_weather.assert_called_once_with("London")
+        weather_service.get_weather.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_warm_single_city_failure(self):
+        """Test that a failed fetch is reported instead of raised."""
+        weather_service = AsyncMock()
+        weather_service.refresh_weather.side_effect = Exception("API down")
+
+        result = await warm_single_city("London", weather_service, AsyncLimiter(100, 1))
+
+        assert result is False
+
+    @pytest.mark.asyncio
+    async def test_warm_single_city_not_refreshed(self):
+        """Test that a refresh that fetched nothing counts as a failure."""
+        weather_service = AsyncMock()
+        weather_service.refresh_weather.return_value = False
+
+        result = await warm_single_city("London", weather_service, AsyncLimiter(100, 1))
+
+        assert result is False
+
+    @pytest.mark.asyncio
+    async def test_warm_worker_drains_queue(self):
+        """Test that a worker warms every queued city and then stops."""
+        weather_service = AsyncMock()
+        queue = asyncio.Queue()
+        for city in ("London", "Paris", "Tokyo"):
+            queue.put_nowait(city)
+
+        results = await warm_worker(queue, weather_service, AsyncLimiter(100, 1))
+
+        assert len(results) == 3
+        assert queue.empty()
+        assert weather_service.refresh_weather.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_warm_cache_partial_token_grant(self):
+        """Test that only cities covered by the bulk token grant are warmed."""
+        weather_cache = AsyncMock()
+        weather_cache.get_many.return_value = [(None, None)] * 3
+        rate_limiter = AsyncMock()
+        rate_limiter.get_rate_limit_remaining.return_value = 50
+        rate_limiter.try_consume_many.return_value = 2
+        stats_tracker = AsyncMock()
+        stats_tracker.get_top_cities.return_value = [
+            ("London", 100),
+            ("Paris", 80),
+            ("Tokyo", 60),
+        ]
+        weather_service = AsyncMock()
+
+        with (
+            patch("app.background.cache_warmer.get_redis_pool", AsyncMock()),
+            patch(
+                "app.background.cache_warmer.WeatherCacheService",
+                return_value=weather_cache,
+            ),
+            patch(
+                "app.background.cache_warmer.RateLimitService",
+                return_value=rate_limiter,
+            ),
+            patch(
+                "app.background.cache_warmer.RequestStatsService",
+                return_value=stats_tracker,
+            ),
+            patch(
+                "app.background.cache_warmer.WeatherService",
+                return_value=weather_service,
+            ),
+            patch("app.background.cache_warmer.settings") as mock_settings,
+        ):
+            mock_settings.cache_warm_min_tokens_remaining = 10
+            mock_settings.cache_warm_max_tokens = 20
+            mock_settings.cache_warm_concurrency = 5
+            mock_settings.cache_warm_rate_per_sec = 100
+            mock_settings.cache_warm_min_dispatch = 1
+
+            result = await warm_cache(MagicMock())
+
+        assert result.failure_ratio == 0.0
+        rate_limiter.try_consume_many.assert_called_once_with(3)
+        rate_limiter.consume_rate_limit_token.assert_not_called()
+        assert weather_service.refresh_weather.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_warm_cache_worker_error(self):
+        """Test that an unexpected worker error fails the whole cycle."""
+        weather_cache = AsyncMock()
+        weather_cache.get_many.return_value = [(None, None)] * 3
+        rate_limiter = AsyncMock()
+        rate_limiter.get_rate_limit_remaining.return_value = 50
+        rate_limiter.try_consume_many.return_value = 3
+        stats_tracker = AsyncMock()
+        stats_tracker.get_top_cities.return_value = [
+            ("London", 100),
+            ("Paris", 80),
+            ("Tokyo", 60),
+        ]
+        weather_service = AsyncMock()
+
+        with (
+            patch("app.background.cache_warmer.get_redis_pool", AsyncMock()),
+            patch(
+                "app.background.cache_warmer.WeatherCacheService",
+                return_value=weather_cache,
+            ),
+            patch(
+                "app.background.cache_warmer.RateLimitService",
+                return_value=rate_limiter,
+            ),
+            patch(
+                "app.background.cache_warmer.RequestStatsService",
+                return_value=stats_tracker,
+            ),
+            patch(
+                "app.background.cache_warmer.WeatherService",
+                return_value=weather_service,
+            ),
+            patch(
+                "app.background.cache_warmer.warm_worker",
+                AsyncMock(side_effect=RuntimeError("boom")),
+            ),
+            patch("app.background.cache_warmer.settings") as mock_settings,
+        ):
+            mock_settings.cache_warm_min_tokens_remaining = 10
+            mock_settings.cache_warm_max_tokens = 20
+            mock_settings.cache_warm_concurrency = 5
+            mock_settings.cache_warm_rate_per_sec = 100
+            mock_settings.cache_warm_min_dispatch = 1
+
+            result = await warm_cache(MagicMock())
+
+        assert result.failure_ratio == 1.0
 
     @pytest.mark.asyncio
     async def test_get_cities_to_warm_with_stats(self):
@@ -55,15 +194,98 @@ class TestCacheWarmer:
         ]
 
         weather_cache = AsyncMock()
-        weather_cache.get_weather.side_effect = [None, None, "cached", "cached"]
+        weather_cache.get_many.return_value = [
+            (None, None),
+            (None, None),
+            ({"cached": 1}, 3000),
+            ({"cached": 1}, 3000),
+        ]
 
-        cities = await get_cities_to_warm(stats_tracker, weather_cache, 3)
+        cities, miss_ratio = await get_cities_to_warm(stats_tracker, weather_cache, 3)
+
+        assert miss_ratio == 0.5
+        weather_cache.get_many.assert_called_once()
+        assert weather_cache.get_many.call_args.args[0] == [
+            "London",
+            "Paris",
+            "Tokyo",
+            "New York",
+        ]
 
         assert len(cities) == 3
         assert cities[0][0] == "London"
         assert cities[1][0] == "Paris"
         assert cities[2][0] == "Tokyo"
 
+    @pytest.mark.asyncio
+    async def test_get_cities_to_warm_prefers_expiring_entries(self):
+        """Test cached cities close to expiry are refreshed first."""
+        stats_tracker = AsyncMock()
+        stats_tracker.get_top_cities.return_value = [
+            ("London", 100),
+            ("Paris", 80),
+            ("Tokyo", 60),
+        ]
+        weather_cache = AsyncMock()
+        weather_cache.get_many.return_value = [
+            ({"cached": 1}, 3500),
+            ({"cached": 1}, 100),
+            (None, None),
+        ]
+
+        with patch("app.background.cache_warmer.settings") as mock_settings:
+            mock_settings.redis_cache_ttl = 3600
+
+            cities, _ = await get_cities_to_warm(stats_tracker, weather_cache, 2)
+
+        assert [city for city, _ in cities] == ["Tokyo", "Paris"]
+
+    @pytest.mark.asyncio
+    async def test_get_cities_to_warm_all_fit(self):
+        """Test that candidates are not reordered when all of them fit."""
+        stats_tracker = AsyncMock()
+        stats_tracker.get_top_cities.return_value = [("London", 100), ("Paris", 80)]
+        weather_cache = AsyncMock()
+        weather_cache.get_many.return_value = [({"cached": 1}, 3500), (None, None)]
+
+        cities, miss_ratio = await get_cities_to_warm(stats_tracker, weather_cache, 5)
+
+        assert cities == [("London", 100), ("Paris", 80)]
+        assert miss_ratio == 0.5
+
+    @pytest.mark.asyncio
+    async def test_get_cities_to_warm_uses_given_date(self):
+        """Test that a precomputed date is used for the cache lookup."""
+        stats_tracker = AsyncMock()
+        stats_tracker.get_top_cities.return_value = [("London", 100)]
+        weather_cache = AsyncMock()
+        weather_cache.get_many.return_value = [(None, None)]
+
+        await get_cities_to_warm(stats_tracker, weather_cache, 1, "2025-07-25")
+
+        weather_cache.get_many.assert_called_once_with(["London"], "2025-07-25")
+
+    @pytest.mark.asyncio
+    async def test_get_cities_to_warm_uses_prefetched_top_cities(self):
+        """Test that prefetched top cities are used instead of a new lookup."""
+        stats_tracker = AsyncMock()
+        weather_cache = AsyncMock()
+        weather_cache.get_many.return_value = [(None, None)] * 2
+
+        cities, _ = await get_cities_to_warm(
+            stats_tracker,
+            weather_cache,
+            1,
+            "2025-07-25",
+            [("London", 100), ("Paris", 80), ("Tokyo", 60)],
+        )
+
+        stats_tracker.get_top_cities.assert_not_called()
+        weather_cache.get_many.assert_called_once_with(
+            ["London", "Paris"], "2025-07-25"
+        )
+        assert cities == [("London", 100)]
+
     @pytest.mark.asyncio
     async def test_get_cities_to_warm_no_stats(self):
         """Test fallback behavior when no statistics exist.
@@ -76,7 +298,9 @@ class TestCacheWarmer:
         stats_tracker.get_top_cities.return_value = []
         weather_cache = AsyncMock()
 
-        cities = await get_cities_to_warm(stats_tracker, weather_cache, 3)
+        cities, miss_ratio = await get_cities_to_warm(stats_tracker, weather_cache, 3)
+
+        assert miss_ratio == 0.0
 
         assert len(cities) == 3
         assert all(count == 0 for _, count in cities)
@@ -89,33 +313,88 @@ class TestCacheWarmer:
         thresholds to ensure sufficient capacity remains for
         real-time user requests.
         """
-        app = MagicMock()
+        rate_limiter = AsyncMock()
+        rate_limiter.get_rate_limit_remaining.return_value = 5
+        stats_tracker = AsyncMock()
+        stats_tracker.get_top_cities.return_value = []
+        services = WarmServices(AsyncMock(), rate_limiter, stats_tracker, AsyncMock())
 
-        with patch("app.background.cache_warmer.get_redis_pool") as mock_pool:
-            mock_redis_client = AsyncMock()
-            mock_pool_instance = AsyncMock()
-            mock_pool_instance.get_client.return_value = mock_redis_client
-            mock_pool.return_value = mock_pool_instance
+        with patch("app.background.cache_warmer.settings") as mock_settings:
+            mock_settings.cache_warm_min_tokens_remaining = 10
+            mock_settings.cache_warm_max_tokens = 20
 
-            with patch(
-                "app.background.cache_warmer.RateLimitService"
-            ) as mock_rate_service:
-                mock_rate_limiter = AsyncMock()
-                mock_rate_limiter.get_rate_limit_remaining = AsyncMock(return_value=5)
-                mock_rate_service.return_value = mock_rate_limiter
+            result = await warm_cache(MagicMock(), services)
 
-                with patch(
-                    "app.background.cache_warmer.RequestStatsService"
-                ) as mock_stats_service:
-                    mock_stats_tracker = AsyncMock()
-                    mock_stats_service.return_value = mock_stats_tracker
+        assert result == WarmResult()
+        rate_limiter.try_consume_many.assert_not_called()
+        services.weather_cache.get_many.assert_not_called()
 
-                    with patch("app.background.cache_warmer.settings") as mock_settings:
-                        mock_settings.cache_warm_min_tokens_remaining = 10
+    @pytest.mark.asyncio
+    async def test_warm_cache_skip_lets_top_cities_lookup_finish(self):
+        """Test a skipped cycle lets the in-flight stats lookup finish."""
+        release = asyncio.Event()
+        lookup = {"completed": False}
+
+        async def gated_top_cities(count):
+            await release.wait()
+            lookup["completed"] = True
+            return [("London", 100)]
+
+        async def remaining_tokens():
+            release.set()
+            return 5
+
+        weather_cache = AsyncMock()
+        rate_limiter = AsyncMock()
+        rate_limiter.get_rate_limit_remaining.side_effect = remaining_tokens
+        stats_tracker = AsyncMock()
+        stats_tracker.get_top_cities.side_effect = gated_top_cities
+        services = WarmServices(weather_cache, rate_limiter, stats_tracker, AsyncMock())
+
+        with patch("app.background.cache_warmer.settings") as mock_settings:
+            mock_settings.cache_warm_min_tokens_remaining = 10
+            mock_settings.cache_warm_max_tokens = 20
 
-                        await warm_cache(app)
+            result = await warm_cache(MagicMock(), services)
 
-                        mock_stats_tracker.get_top_cities.assert_not_called()
+        assert result.failure_ratio == 0.0
+        assert lookup["completed"] is True
+        weather_cache.get_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_warm_cache_below_min_dispatch(self):
+        """Test that a cycle too small to be worth dispatching is skipped."""
+        weather_cache = AsyncMock()
+        rate_limiter = AsyncMock()
+        rate_limiter.get_rate_limit_remaining.return_value = 55
+        stats_tracker = AsyncMock()
+
+        with (
+            patch("app.background.cache_warmer.get_redis_pool", AsyncMock()),
+            patch(
+                "app.background.cache_warmer.WeatherCacheService",
+                return_value=weather_cache,
+            ),
+            patch(
+                "app.background.cache_warmer.RateLimitService",
+                return_value=rate_limiter,
+            ),
+            patch(
+                "app.background.cache_warmer.RequestStatsService",
+                return_value=stats_tracker,
+            ),
+            patch("app.background.cache_warmer.WeatherService"),
+            patch("app.background.cache_warmer.settings") as mock_settings,
+        ):
+            mock_settings.cache_warm_min_tokens_remaining = 50
+            mock_settings.cache_warm_max_tokens = 20
+            mock_settings.cache_warm_min_dispatch = 10
+
+            result = await warm_cache(MagicMock())
+
+        assert result.failure_ratio == 0.0
+        weather_cache.get_many.assert_not_called()
+        rate_limiter.try_consume_many.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_warm_cache_concurrent_execution(self):
@@ -133,7 +412,7 @@ class TestCacheWarmer:
                 "app.background.cache_warmer.WeatherCacheService"
             ) as mock_cache_service:
                 mock_weather_cache = AsyncMock()
-                mock_weather_cache.get_weather.return_value = None
+                mock_weather_cache.get_many.return_value = [(None, None)] * 3
                 mock_cache_service.return_value = mock_weather_cache
 
                 with patch(
@@ -143,9 +422,7 @@ class TestCacheWarmer:
                     mock_rate_limiter.get_rate_limit_remaining = AsyncMock(
                         return_value=50
                     )
-                    mock_rate_limiter.consume_rate_limit_token = AsyncMock(
-                        return_value=True
-                    )
+                    mock_rate_limiter.try_consume_many = AsyncMock(return_value=3)
                     mock_rate_service.return_value = mock_rate_limiter
 
                     with patch(
@@ -163,9 +440,7 @@ class TestCacheWarmer:
                             "app.background.cache_warmer.WeatherService"
                         ) as mock_weather_service_class:
                             mock_weather_service = AsyncMock()
-                            mock_weather_service.get_weather.return_value = {
-                                "data": "weather"
-                            }
+                            mock_weather_service.refresh_weather.return_value = True
                             mock_weather_service_class.return_value = (
                                 mock_weather_service
                             )
@@ -175,10 +450,15 @@ class TestCacheWarmer:
                             ) as mock_settings:
                                 mock_settings.cache_warm_min_tokens_remaining = 10
                                 mock_settings.cache_warm_max_tokens = 20
+                                mock_settings.cache_warm_concurrency = 5
+                                mock_settings.cache_warm_rate_per_sec = 100
+                                mock_settings.cache_warm_min_dispatch = 1
 
                                 await warm_cache(app)
 
-                                assert mock_weather_service.get_weather.call_count == 3
+                                assert (
+                                    mock_weather_service.refresh_weather.call_count == 3
+                                )
 
     @pytest.mark.asyncio
     async def test_cache_warmer_task_cancellation(self):
@@ -193,6 +473,84 @@ class TestCacheWarmer:
             with pytest.raises(asyncio.CancelledError):
                 await task
 
+    @pytest.mark.asyncio
+    async def test_cache_warmer_task_retries_on_high_failure_ratio(self):
+        """Test that a mostly failed warm run is retried after 60 seconds."""
+        app = MagicMock()
+        sleep = AsyncMock(side_effect=[None, asyncio.CancelledError()])
+
+        with (
+            patch("app.background.cache_warmer.create_warm_services", AsyncMock()),
+            patch(
+                "app.background.cache_warmer.warm_cache",
+                AsyncMock(return_value=WarmResult(failure_ratio=1.0)),
+            ),
+            patch("app.background.cache_warmer.asyncio.sleep", sleep),
+        ):
+            await cache_warmer_task(app)
+
+        sleep.assert_awaited_with(60)
+
+    @pytest.mark.asyncio
+    async def test_cache_warmer_task_reuses_services(self):
+        """Test that warm services are built once and reused across cycles."""
+        app = MagicMock()
+        services = MagicMock()
+        warm = AsyncMock(return_value=WarmResult())
+        sleep = AsyncMock(side_effect=[None, None, asyncio.CancelledError()])
+
+        with (
+            patch(
+                "app.background.cache_warmer.create_warm_services",
+                AsyncMock(return_value=services),
+            ) as create_services,
+            patch("app.background.cache_warmer.warm_cache", warm),
+            patch("app.background.cache_warmer.asyncio.sleep", sleep),
+        ):
+            await cache_warmer_task(app)
+
+        create_services.assert_awaited_once()
+        assert warm.await_count == 2
+        assert all(call.args[1] is services for call in warm.await_args_list)
+
+    def test_next_warm_interval(self):
+        """Test the warm interval shrinks on misses and grows on hits."""
+        with patch("app.background.cache_warmer.settings") as mock_settings:
+            mock_settings.cache_warm_min_interval = 600
+            mock_settings.cache_warm_max_interval = 14400
+
+            assert next_warm_interval(3600, 0.8) == 1800
+            assert next_warm_interval(3600, 0.2) == 7200
+            assert next_warm_interval(1000, 1.0) == 600
+            assert next_warm_interval(10000, 0.0) == 14400
+
+    @pytest.mark.asyncio
+    async def test_warm_cache_skips_when_already_running(self):
+        """Test that overlapping warm cycles do not run concurrently."""
+        create_services = AsyncMock()
+
+        with patch("app.background.cache_warmer.create_warm_services", create_services):
+            async with cache_warmer._warm_lock:
+                result = await warm_cache(MagicMock())
+
+        assert result == WarmResult()
+        create_services.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_start_cache_warmer_reuses_running_task(self):
+        """Test that a second start returns the task already running."""
+        app = MagicMock()
+        running = asyncio.create_task(asyncio.sleep(10))
+        app.state.cache_warmer_task = running
+
+        with patch("app.background.cache_warmer.settings") as mock_settings:
+            mock_settings.enable_cache_warming = True
+
+            task = await start_cache_warmer(app)
+
+        assert task is running
+        running.cancel()
+
     @pytest.mark.asyncio
     async def test_start_cache_warmer_disabled(self):
         """Test starting cache warmer when disabled."""
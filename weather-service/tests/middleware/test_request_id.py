@@ -0,0 +1,72 @@
+"""
+Tests for the request ID middleware.
+"""
+
+import re
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.middleware.request_id import RequestIDMiddleware
+
+REQUEST_ID_PATTERN = re.compile(r"^req_[0-9a-f]{8}_\d{13}$")
+
+
+class TestRequestIDMiddleware:
+    """Test suite for request ID assignment.
+
+    Validates that every response carries a correlation ID and that
+    the same ID is exposed to handlers through the request state.
+    """
+
+    def _client(self) -> TestClient:
+        test_app = FastAPI()
+        test_app.add_middleware(RequestIDMiddleware)
+
+        @test_app.get("/ping")
+        async def ping(request: Request):
+            return {"request_id": request.state.request_id}
+
+        return TestClient(test_app)
+
+    def test_request_id_header(self):
+        """Test the response header matches the request state ID."""
+        response = self._client().get("/ping")
+
+        request_id = response.headers["X-Request-ID"]
+        assert REQUEST_ID_PATTERN.match(request_id)
+        assert response.json()["request_id"] == request_id
+
+    def test_request_ids_are_unique(self):
+        """Test consecutive requests get different IDs."""
+        client = self._client()
+
+        first = client.get("/ping").headers["X-Request-ID"]
+        second = client.get("/ping").headers["X-Request-ID"]
+
+        assert first != second
+
+    def test_incoming_request_id_reused(self):
+        """Test a valid client-supplied ID is propagated instead of replaced."""
+        response = self._client().get(
+            "/ping", headers={"X-Request-ID": "gateway-abc123"}
+        )
+
+        assert response.headers["X-Request-ID"] == "gateway-abc123"
+        assert response.json()["request_id"] == "gateway-abc123"
+
+    def test_invalid_incoming_request_id_replaced(self):
+        """Test oversized or malformed client IDs are not trusted."""
+        client = self._client()
+
+        for incoming in ("x" * 129, "has space"):
+            response = client.get("/ping", headers={"X-Request-ID": incoming})
+
+            assert REQUEST_ID_PATTERN.match(response.headers["X-Request-ID"])
+
+    def test_request_id_on_error_response(self):
+        """Test responses produced outside the handler also get an ID."""
+        response = self._client().get("/missing")
+
+        assert response.status_code == 404
+        assert REQUEST_ID_PATTERN.match(response.headers["X-Request-ID"])
@@ -3,12 +3,18 @@ Tests for the dummy external API module.
 """
 
 from datetime import datetime, UTC, timedelta
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from app.definitions.data_sources import WeatherCondition, WindDirections
-from app.services.dummy_external_api import DummyWeatherAPI, RateLimitTracker
+from app.services.dummy_external_api import (
+    DummyWeatherAPI,
+    RateLimitTracker,
+    build_condition_table,
+    build_hourly_condition_tables,
+    sample_condition,
+)
 
 
 class TestRateLimitTracker:
@@ -19,7 +25,7 @@ class TestRateLimitTracker:
         tracker = RateLimitTracker(requests_per_hour=50)
 
         assert tracker.requests_per_hour == 50
-        assert tracker.window_start is None
+        assert tracker.tokens == 50
         assert tracker.request_count == 0
 
     def test_can_make_request_first_time(self):
@@ -27,7 +33,6 @@ class TestRateLimitTracker:
         tracker = RateLimitTracker()
 
         assert tracker.can_make_request() is True
-        assert tracker.window_start is not None
         assert tracker.request_count == 0
 
     def test_record_request(self):
@@ -53,20 +58,26 @@ class TestRateLimitTracker:
         assert tracker.can_make_request() is False
         assert tracker.get_remaining_requests() == 0
 
-    def test_window_reset(self):
-        """Test rate limit window reset after an hour."""
-        tracker = RateLimitTracker(requests_per_hour=1)
+    def test_tokens_refill_over_time(self):
+        """Test capacity returns gradually as time passes."""
+        tracker = RateLimitTracker(requests_per_hour=2)
 
-        assert tracker.can_make_request() is True
+        tracker.record_request()
         tracker.record_request()
         assert tracker.can_make_request() is False
 
-        original_window = tracker.window_start
-        tracker.window_start = datetime.now(UTC) - timedelta(hours=1, minutes=1)
-
+        # Half an hour refills one of the two hourly tokens
+        tracker.last_refill -= 1800
         assert tracker.can_make_request() is True
-        assert tracker.request_count == 0
-        assert tracker.window_start > original_window
+        assert tracker.get_remaining_requests() == 1
+
+    def test_tokens_capped_at_capacity(self):
+        """Test idle time does not bank more than an hour of requests."""
+        tracker = RateLimitTracker(requests_per_hour=2)
+
+        tracker.last_refill -= 7200
+
+        assert tracker.get_remaining_requests() == 2
 
     def test_get_remaining_requests(self):
         """Test getting remaining requests."""
@@ -83,15 +94,30 @@ class TestRateLimitTracker:
         assert tracker.get_remaining_requests() == 0
 
     def test_get_reset_time(self):
-        """Test getting reset time."""
-        tracker = RateLimitTracker()
+        """Test the reset time is when the next token becomes available."""
+        tracker = RateLimitTracker(requests_per_hour=1)
 
-        reset_time_before = tracker.get_reset_time()
-        assert isinstance(reset_time_before, datetime)
+        assert tracker.get_seconds_until_reset() == 0.0
+        assert isinstance(tracker.get_reset_time(), datetime)
 
-        tracker.can_make_request()
+        tracker.record_request()
         reset_time = tracker.get_reset_time()
-        assert reset_time == tracker.window_start + timedelta(hours=1)
+        expected = datetime.now(UTC) + timedelta(hours=1)
+        assert abs(reset_time - expected) < timedelta(seconds=1)
+        assert 3599 < tracker.get_seconds_until_reset() <= 3600
+
+    def test_snapshot(self):
+        """Test the snapshot matches the individual accessors."""
+        tracker = RateLimitTracker(requests_per_hour=1)
+
+        assert tracker.snapshot() == (1, 0.0, True, None)
+
+        tracker.record_request()
+        snapshot = tracker.snapshot()
+        assert snapshot.remaining == 0
+        assert 3599 < snapshot.seconds_until_reset <= 3600
+        assert snapshot.can_make_request is False
+        assert 0 <= snapshot.window_age < 1
 
 
 class TestDummyWeatherAPI:
@@ -132,16 +158,65 @@ class TestDummyWeatherAPI:
         assert temp_2pm > temp_6am
         assert temp_10pm < temp_2pm
 
-    def test_select_weather_condition(self):
+    def test_sample_condition(self):
         """Test weather condition selection."""
-        api = DummyWeatherAPI()
-
-        conditions = [(WeatherCondition.CLEAR, 1.0)]
+        table = build_condition_table([(WeatherCondition.CLEAR, 1.0)])
 
         for _ in range(10):
-            assert (
-                api.select_weather_condition(conditions) == WeatherCondition.CLEAR.value
-            )
+            assert sample_condition(table) == WeatherCondition.CLEAR.value
+
+    def test_condition_table_preserves_weights(self):
+        """Test the alias table assigns each condition its exact weight."""
+        conditions = [
+            (WeatherCondition.RAINY, 0.3),
+            (WeatherCondition.CLOUDY, 0.5),
+            (WeatherCondition.CLEAR, 0.2),
+        ]
+
+        prob, alias, values = build_condition_table(conditions)
+
+        mass = dict.fromkeys(values, 0.0)
+        for slot, keep in enumerate(prob):
+            mass[values[slot]] += keep / len(values)
+            mass[values[alias[slot]]] += (1 - keep) / len(values)
+
+        for condition, weight in conditions:
+            assert mass[condition.value] == pytest.approx(weight)
+
+    def test_sample_condition_uses_single_draw(self):
+        """Test a draw resolves to its slot or that slot's alias."""
+        table = build_condition_table(
+            [(WeatherCondition.RAINY, 0.5), (WeatherCondition.CLEAR, 0.5)]
+        )
+
+        with patch("random.random", return_value=0.25):
+            assert sample_condition(table) == WeatherCondition.RAINY.value
+        with patch("random.random", return_value=0.75):
+            assert sample_condition(table) == WeatherCondition.CLEAR.value
+
+    def test_hourly_condition_tables_blend_dominant(self):
+        """Test hourly tables keep the dominant condition 80% of the time."""
+        conditions = [(WeatherCondition.RAINY, 0.5), (WeatherCondition.CLEAR, 0.5)]
+
+        tables = build_hourly_condition_tables(conditions)
+
+        prob, alias, values = tables[WeatherCondition.RAINY.value]
+        mass = dict.fromkeys(values, 0.0)
+        for slot, keep in enumerate(prob):
+            mass[values[slot]] += keep / len(values)
+            mass[values[alias[slot]]] += (1 - keep) / len(values)
+
+        assert mass[WeatherCondition.RAINY.value] == pytest.approx(0.9)
+        assert mass[WeatherCondition.CLEAR.value] == pytest.approx(0.1)
+
+    def test_patterns_have_condition_tables(self):
+        """Test every city pattern carries a precomputed sampling table."""
+        for pattern in DummyWeatherAPI.CITY_WEATHER_PATTERNS.values():
+            prob, alias, values = pattern["condition_table"]
+
+            assert len(values) == len(prob) == len(alias)
+            assert len(values) == len(pattern["conditions"])
+            assert set(pattern["hourly_condition_tables"]) == set(values)
 
     def test_generate_mock_weather_data(self):
         """Test mock weather data generation."""
@@ -196,6 +271,23 @@ class TestDummyWeatherAPI:
             with pytest.raises(ValueError, match="simulated server error"):
                 await api.fetch_weather("London")
 
+    @pytest.mark.asyncio
+    async def test_fetch_weather_simulation_disabled(self):
+        """Test a zero delay and error rate skip the sleep and failure roll."""
+        api = DummyWeatherAPI()
+
+        with (
+            patch("app.services.dummy_external_api.settings") as mock_settings,
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            patch("random.random", return_value=0.0),
+        ):
+            mock_settings.dummy_api_delay_max = 0
+            mock_settings.dummy_api_error_rate = 0
+            result = await api.fetch_weather("London")
+
+        assert len(result["result"]) == 24
+        mock_sleep.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_fetch_weather_with_circuit_breaker(self):
         """Test that fetch_weather uses circuit breaker."""
@@ -220,8 +312,17 @@ class TestDummyWeatherAPI:
         assert info["requests_made"] == 2
         assert info["requests_remaining"] == 98
         assert info["can_make_request"] is True
-        assert "window_start" in info
         assert "window_reset" in info
+        window_start = datetime.fromisoformat(info["window_start"])
+        assert abs(datetime.now(UTC) - window_start) < timedelta(seconds=1)
+
+    def test_get_rate_limit_info_full_bucket(self):
+        """Test a full bucket reports no requests and no window start."""
+        info = DummyWeatherAPI().get_rate_limit_info()
+
+        assert info["requests_made"] == 0
+        assert info["requests_remaining"] == 100
+        assert info["window_start"] is None
 
     def test_hourly_data_structure(self):
         """Test that hourly data has all required fields."""
@@ -234,7 +335,13 @@ class TestDummyWeatherAPI:
             "pattern": api.CITY_WEATHER_PATTERNS["default"],
         }
 
-        hour_data = api._generate_hourly_data(12, base_data)
+        series = api._generate_hourly_series(base_data)
+        hour_data = series[12]
+
+        assert [entry["hour"] for entry in series] == list(range(24))
+        assert [entry["temperature"] for entry in series] == [
+            f"{api.generate_temperature_curve(20, hour)}°C" for hour in range(24)
+        ]
 
         required_fields = [
             "hour",
@@ -105,6 +105,28 @@ class TestQueueService:
         assert str(exc_info.value) == "General error"
         mock_redis.zadd.assert_called_once()
 
+    async def test_add_many_to_queue(self, queue_service, mock_redis):
+        """Test batch enqueueing sends a single multi-member ZADD.
+
+        Validates cities are normalized to lowercase and each keeps its
+        own negated priority score.
+        """
+        mock_redis.zadd.return_value = 2
+
+        count = await queue_service.add_many_to_queue([("London", 5), ("Paris", 1)])
+
+        assert count == 2
+        mock_redis.zadd.assert_called_once_with(
+            "weather:queue:cities", {"london": -5, "paris": -1}
+        )
+
+    async def test_add_many_to_queue_empty(self, queue_service, mock_redis):
+        """Test an empty batch does not call Redis."""
+        count = await queue_service.add_many_to_queue([])
+
+        assert count == 0
+        mock_redis.zadd.assert_not_called()
+
     async def test_get_from_queue_success(self, queue_service, mock_redis):
         """Test retrieving highest priority item from queue.
 
@@ -188,6 +210,19 @@ class TestQueueService:
         assert str(exc_info.value) == "General error"
         mock_redis.zpopmin.assert_called_once()
 
+    async def test_get_many_from_queue(self, queue_service, mock_redis):
+        """Test batch retrieval pops several items in one ZPOPMIN call.
+
+        Validates byte and string members are both returned as strings
+        in priority order.
+        """
+        mock_redis.zpopmin.return_value = [(b"london", -10.0), ("paris", -5.0)]
+
+        cities = await queue_service.get_many_from_queue(3)
+
+        assert cities == ["london", "paris"]
+        mock_redis.zpopmin.assert_called_once_with("weather:queue:cities", 3)
+
     async def test_get_queue_size_success(self, queue_service, mock_redis):
         """Test retrieving current queue size.
 
@@ -2,16 +2,29 @@
 Tests for the rate limiting service with mocked Redis.
 """
 
-from unittest.mock import patch, MagicMock
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from app.config import get_settings
-from app.services.rate_limit_service import RateLimitService
+from app.services.rate_limit_service import (
+    RATE_LIMIT_WINDOW_MS,
+    SLIDING_WINDOW_SCRIPT,
+    RateLimitService,
+)
 
 settings = get_settings()
 
 
+def _make_rate_limiter(script: AsyncMock) -> RateLimitService:
+    """Build a rate limiter whose Lua script is replaced by a mock."""
+    redis_client = MagicMock()
+    redis_client.register_script.return_value = script
+    return RateLimitService(redis_client)
+
+
 @pytest.mark.asyncio
 class TestRateLimitService:
     """Test suite for distributed rate limiting service.
@@ -20,11 +33,7 @@ class TestRateLimitService:
     and error handling for the Redis-backed rate limiter.
     """
 
-    @patch("app.services.rate_limit_service.RedisStorage")
-    @patch("app.services.rate_limit_service.MovingWindowRateLimiter")
-    async def test_consume_rate_limit_token_success(
-        self, mock_limiter_class, mock_storage_class
-    ):
+    async def test_consume_rate_limit_token_success(self):
         """Test successful rate limit token consumption.
 
         Verifies that when rate limit capacity is available,
@@ -32,25 +41,15 @@ class TestRateLimitService:
         is allowed to proceed.
         """
 
-        mock_storage = MagicMock()
-        mock_storage_class.return_value = mock_storage
-
-        mock_limiter = MagicMock()
-        mock_limiter.hit.return_value = True
-        mock_limiter_class.return_value = mock_limiter
-
-        rate_limiter = RateLimitService()
+        script = AsyncMock(return_value=[1, 99])
+        rate_limiter = _make_rate_limiter(script)
 
         result = await rate_limiter.consume_rate_limit_token("test_id")
 
         assert result is True
-        mock_limiter.hit.assert_called_once()
+        script.assert_awaited_once()
 
-    @patch("app.services.rate_limit_service.RedisStorage")
-    @patch("app.services.rate_limit_service.MovingWindowRateLimiter")
-    async def test_consume_rate_limit_token_exceeded(
-        self, mock_limiter_class, mock_storage_class
-    ):
+    async def test_consume_rate_limit_token_exceeded(self):
         """Test rate limit enforcement when capacity exhausted.
 
         Validates that when the rate limit is exceeded,
@@ -58,25 +57,15 @@ class TestRateLimitService:
         operation is blocked to protect the system.
         """
 
-        mock_storage = MagicMock()
-        mock_storage_class.return_value = mock_storage
-
-        mock_limiter = MagicMock()
-        mock_limiter.hit.return_value = False
-        mock_limiter_class.return_value = mock_limiter
-
-        rate_limiter = RateLimitService()
+        script = AsyncMock(return_value=[0, 0])
+        rate_limiter = _make_rate_limiter(script)
 
         result = await rate_limiter.consume_rate_limit_token("test_id")
 
         assert result is False
-        mock_limiter.hit.assert_called_once()
+        script.assert_awaited_once()
 
-    @patch("app.services.rate_limit_service.RedisStorage")
-    @patch("app.services.rate_limit_service.MovingWindowRateLimiter")
-    async def test_consume_rate_limit_token_error_handling(
-        self, mock_limiter_class, mock_storage_class
-    ):
+    async def test_consume_rate_limit_token_error_handling(self):
         """Test graceful degradation on rate limiter errors.
 
         Ensures that when the rate limiting infrastructure
@@ -84,76 +73,116 @@ class TestRateLimitService:
         requests) to prevent overwhelming downstream services.
         """
 
-        mock_storage = MagicMock()
-        mock_storage_class.return_value = mock_storage
-
-        mock_limiter = MagicMock()
-        mock_limiter.hit.side_effect = Exception("Test error")
-        mock_limiter_class.return_value = mock_limiter
-
-        rate_limiter = RateLimitService()
+        script = AsyncMock(side_effect=Exception("Test error"))
+        rate_limiter = _make_rate_limiter(script)
 
         result = await rate_limiter.consume_rate_limit_token("test_id")
 
         assert result is False
 
-    @patch("app.services.rate_limit_service.RedisStorage")
-    @patch("app.services.rate_limit_service.MovingWindowRateLimiter")
-    async def test_get_rate_limit_remaining(
-        self, mock_limiter_class, mock_storage_class
-    ):
-        """Test getting remaining rate limit tokens."""
+    async def test_consume_uses_single_script_call(self):
+        """Test a token is consumed with one atomic script invocation.
+
+        Verifies the key, window, limit and requested token count are
+        passed to the sliding window script.
+        """
+
+        script = AsyncMock(return_value=[1, 99])
+        rate_limiter = _make_rate_limiter(script)
 
-        mock_storage = MagicMock()
-        mock_storage_class.return_value = mock_storage
+        await rate_limiter.consume_rate_limit_token("test_id")
 
-        mock_limiter = MagicMock()
+        kwargs = script.await_args.kwargs
+        assert kwargs["keys"] == ["rate_limit:test_id"]
+        assert kwargs["args"][:3] == [
+            RATE_LIMIT_WINDOW_MS,
+            settings.rate_limit_requests,
+            1,
+        ]
 
-        mock_limiter.get_window_stats.return_value = (0, 30)
-        mock_limiter_class.return_value = mock_limiter
+    async def test_get_rate_limit_remaining(self):
+        """Test getting remaining rate limit tokens."""
 
-        rate_limiter = RateLimitService()
+        script = AsyncMock(return_value=[0, 70])
+        rate_limiter = _make_rate_limiter(script)
 
         remaining = await rate_limiter.get_rate_limit_remaining("test_id")
 
         assert remaining == 70
-        mock_limiter.get_window_stats.assert_called_once()
+        assert script.await_args.kwargs["args"][2] == 0
 
-    @patch("app.services.rate_limit_service.RedisStorage")
-    @patch("app.services.rate_limit_service.MovingWindowRateLimiter")
-    async def test_get_rate_limit_remaining_error_handling(
-        self, mock_limiter_class, mock_storage_class
-    ):
+    async def test_get_rate_limit_remaining_error_handling(self):
         """Test error handling when getting remaining tokens."""
 
-        mock_storage = MagicMock()
-        mock_storage_class.return_value = mock_storage
-
-        mock_limiter = MagicMock()
-        mock_limiter.get_window_stats.side_effect = Exception("Test error")
-        mock_limiter_class.return_value = mock_limiter
-
-        rate_limiter = RateLimitService()
+        script = AsyncMock(side_effect=Exception("Test error"))
+        rate_limiter = _make_rate_limiter(script)
 
         remaining = await rate_limiter.get_rate_limit_remaining("test_id")
 
         assert remaining == 0
 
-    @patch("app.services.rate_limit_service.RedisStorage")
-    @patch("app.services.rate_limit_service.MovingWindowRateLimiter")
-    async def test_initialization(self, mock_limiter_class, mock_storage_class):
+    async def test_initialization(self):
         """Test rate limiter initialization."""
 
-        mock_storage = MagicMock()
-        mock_storage_class.return_value = mock_storage
+        redis_client = MagicMock()
+
+        rate_limiter = RateLimitService(redis_client)
+
+        redis_client.register_script.assert_called_once_with(SLIDING_WINDOW_SCRIPT)
+        assert rate_limiter.redis_client is redis_client
+        assert rate_limiter.limit == settings.rate_limit_requests
+
+    async def test_try_consume_many_partial(self):
+        """Test bulk consumption is capped at the remaining tokens.
+
+        Verifies that the grant is reserved with a single script call
+        rather than one call per token.
+        """
+        script = AsyncMock(return_value=[3, 0])
+        rate_limiter = _make_rate_limiter(script)
+
+        result = await rate_limiter.try_consume_many(5, "test_id")
+
+        assert result == 3
+        script.assert_awaited_once()
+        assert script.await_args.kwargs["args"][2] == 5
+
+    async def test_try_consume_many_exhausted(self):
+        """Test bulk consumption grants nothing when no tokens remain."""
+        script = AsyncMock(return_value=[0, 0])
+        rate_limiter = _make_rate_limiter(script)
+
+        result = await rate_limiter.try_consume_many(5, "test_id")
+
+        assert result == 0
+
+    async def test_try_consume_many_error_handling(self):
+        """Test bulk consumption grants nothing on limiter errors."""
+        script = AsyncMock(side_effect=Exception("Test error"))
+        rate_limiter = _make_rate_limiter(script)
+
+        result = await rate_limiter.try_consume_many(5, "test_id")
+
+        assert result == 0
+
+    async def test_concurrent_consumers_do_not_serialize(self):
+        """Test that concurrent token checks overlap instead of queueing.
+
+        A slow limiter round trip must not make other callers wait behind
+        it, so the total time stays close to a single round trip.
+        """
 
-        mock_limiter = MagicMock()
-        mock_limiter_class.return_value = mock_limiter
+        async def slow_script(*args, **kwargs):
+            await asyncio.sleep(0.1)
+            return [1, 99]
 
-        rate_limiter = RateLimitService()
+        rate_limiter = _make_rate_limiter(AsyncMock(side_effect=slow_script))
 
-        mock_storage_class.assert_called_once_with(settings.redis_url)
-        mock_limiter_class.assert_called_once_with(mock_storage)
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(rate_limiter.consume_rate_limit_token("test_id") for _ in range(4))
+        )
+        elapsed = time.perf_counter() - start
 
-        assert len(rate_limiter.rate_limits) == 1
-        assert rate_limiter.rate_limits[0].amount == settings.rate_limit_requests
+        assert all(results)
+        assert elapsed < 0.3
@@ -2,18 +2,29 @@
 Tests for the request stats service module.
 """
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 import redis.asyncio as redis
 
-from app.services.request_stats_service import RequestStatsService
+from app.config import get_settings
+from app.services.request_stats_service import RECORD_CITY_SCRIPT, RequestStatsService
+
+settings = get_settings()
+
+
+@pytest.fixture
+def mock_script():
+    """Create a mock for the registered Lua script."""
+    return AsyncMock(return_value=1)
 
 
 @pytest.fixture
-def mock_redis():
+def mock_redis(mock_script):
     """Create a mock Redis client."""
-    return AsyncMock()
+    client = AsyncMock()
+    client.register_script = MagicMock(return_value=mock_script)
+    return client
 
 
 @pytest.fixture
@@ -25,45 +36,47 @@ def stats_service(mock_redis):
 class TestRequestStatsService:
     """Test cases for RequestStatsService."""
 
-    async def test_increment_stats_success(self, stats_service, mock_redis):
-        """Test successful stats increment."""
-        mock_redis.incr.return_value = 1
-        mock_redis.expire.return_value = True
-        mock_redis.zincrby.return_value = 1.0
+    async def test_increment_stats_success(self, stats_service, mock_script):
+        """Test successful stats increment in a single script round-trip."""
 
         await stats_service.increment_stats("London")
 
-        mock_redis.incr.assert_called_once_with("weather:stats:london:request_count")
-        assert mock_redis.expire.call_count == 2
-        mock_redis.zincrby.assert_called_once_with("top_cities", 1, "london")
+        mock_script.assert_awaited_once_with(
+            keys=["top_cities"],
+            args=["london", settings.top_cities_capacity, 86400 * 7],
+        )
+
+    def test_record_city_script_registered(self, mock_redis):
+        """Test the Space-Saving script is registered once at construction."""
+        RequestStatsService(mock_redis)
+
+        mock_redis.register_script.assert_called_once_with(RECORD_CITY_SCRIPT)
 
-    async def test_increment_stats_connection_error(self, stats_service, mock_redis):
+    async def test_increment_stats_connection_error(self, stats_service, mock_script):
         """Test handling connection error in increment_stats."""
-        mock_redis.incr.side_effect = redis.ConnectionError("Connection failed")
+        mock_script.side_effect = redis.ConnectionError("Connection failed")
 
         with pytest.raises(redis.ConnectionError):
             await stats_service.increment_stats("London")
 
-    async def test_increment_stats_timeout_error(self, stats_service, mock_redis):
+    async def test_increment_stats_timeout_error(self, stats_service, mock_script):
         """Test handling timeout error in increment_stats."""
-        mock_redis.incr.side_effect = redis.TimeoutError("Timeout")
+        mock_script.side_effect = redis.TimeoutError("Timeout")
 
         await stats_service.increment_stats("London")
 
-        mock_redis.incr.assert_called_once()
+        mock_script.assert_awaited_once()
 
-    async def test_increment_stats_general_error(self, stats_service, mock_redis):
+    async def test_increment_stats_general_error(self, stats_service, mock_script):
         """Test handling general error in increment_stats."""
-        mock_redis.incr.side_effect = Exception("General error")
+        mock_script.side_effect = Exception("General error")
 
         await stats_service.increment_stats("London")
 
-        mock_redis.incr.assert_called_once()
-
     async def test_get_top_cities_success(self, stats_service, mock_redis):
         """Test getting top cities by request count."""
 
-        mock_redis.zrevrange.return_value = [
+        mock_redis.zrange.return_value = [
             (b"london", 100.0),
             (b"paris", 75.0),
             (b"berlin", 50.0),
@@ -76,13 +89,13 @@ class TestRequestStatsService:
         assert result[1] == ("paris", 75)
         assert result[2] == ("berlin", 50)
 
-        mock_redis.zrevrange.assert_called_once_with(
-            "top_cities", 0, 2, withscores=True
+        mock_redis.zrange.assert_called_once_with(
+            "top_cities", 0, 2, desc=True, withscores=True
         )
 
     async def test_get_top_cities_string_cities(self, stats_service, mock_redis):
         """Test get_top_cities when cities are already strings."""
-        mock_redis.zrevrange.return_value = [("london", 100.0), ("paris", 75.0)]
+        mock_redis.zrange.return_value = [("london", 100.0), ("paris", 75.0)]
 
         result = await stats_service.get_top_cities(count=2)
 
@@ -92,24 +105,38 @@ class TestRequestStatsService:
 
     async def test_get_top_cities_default_count(self, stats_service, mock_redis):
         """Test get_top_cities with default count."""
-        mock_redis.zrevrange.return_value = []
+        mock_redis.zrange.return_value = []
 
         await stats_service.get_top_cities()
 
-        mock_redis.zrevrange.assert_called_once_with(
-            "top_cities", 0, 49, withscores=True
+        mock_redis.zrange.assert_called_once_with(
+            "top_cities", 0, 49, desc=True, withscores=True
+        )
+
+    async def test_get_top_cities_count_capped(self, stats_service, mock_redis):
+        """Test get_top_cities never asks for more than the set capacity."""
+        mock_redis.zrange.return_value = []
+
+        await stats_service.get_top_cities(count=settings.top_cities_capacity + 10)
+
+        mock_redis.zrange.assert_called_once_with(
+            "top_cities",
+            0,
+            settings.top_cities_capacity - 1,
+            desc=True,
+            withscores=True,
         )
 
     async def test_get_top_cities_connection_error(self, stats_service, mock_redis):
         """Test handling connection error in get_top_cities."""
-        mock_redis.zrevrange.side_effect = redis.ConnectionError("Connection failed")
+        mock_redis.zrange.side_effect = redis.ConnectionError("Connection failed")
 
         with pytest.raises(redis.ConnectionError):
             await stats_service.get_top_cities()
 
     async def test_get_top_cities_timeout_error(self, stats_service, mock_redis):
         """Test handling timeout error in get_top_cities."""
-        mock_redis.zrevrange.side_effect = redis.TimeoutError("Timeout")
+        mock_redis.zrange.side_effect = redis.TimeoutError("Timeout")
 
         result = await stats_service.get_top_cities()
 
@@ -117,7 +144,7 @@ class TestRequestStatsService:
 
     async def test_get_top_cities_general_error(self, stats_service, mock_redis):
         """Test handling general error in get_top_cities."""
-        mock_redis.zrevrange.side_effect = Exception("General error")
+        mock_redis.zrange.side_effect = Exception("General error")
 
         result = await stats_service.get_top_cities()
 
@@ -162,11 +189,3 @@ class TestRequestStatsService:
         result = await stats_service.get_city_stats("London")
 
         assert result == 0
-
-    def test_get_stats_key(self, stats_service):
-        """Test stats key generation."""
-        key = stats_service._get_stats_key("London")
-        assert key == "weather:stats:london:request_count"
-
-        key = stats_service._get_stats_key("LONDON")
-        assert key == "weather:stats:london:request_count"
@@ -6,19 +6,30 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from app.services.weather_cache_service import WeatherCacheService
+from app.services.weather_cache_service import (
+    WeatherCacheService,
+    local_response_cache,
+)
 
 
 @pytest.mark.asyncio
 class TestWeatherCacheService:
     """Test cases for the weather cache service."""
 
+    @pytest.fixture(autouse=True)
+    def clear_local_cache(self):
+        """Isolate tests from the process-wide response cache."""
+        local_response_cache.clear()
+        yield
+        local_response_cache.clear()
+
     @pytest.fixture
     def mock_redis_client(self):
         """Create a mock Redis client."""
         mock_client = MagicMock()
         mock_client.get = AsyncMock(return_value=None)
         mock_client.setex = AsyncMock()
+        mock_client.register_script.return_value = AsyncMock(return_value=None)
         return mock_client
 
     async def test_get_weather_cache_miss(self, mock_redis_client):
@@ -56,14 +67,26 @@ class TestWeatherCacheService:
             "result": [{"hour": 0, "temperature": "18", "condition": "Clear"}]
         }
 
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[True, True, 2])
+        mock_redis_client.pipeline = MagicMock(return_value=pipe)
+        response_key = "weather:response:v2:london:2025-07-25"
+        local_response_cache[response_key] = b"{}"
+
         await cache_service.set_weather("London", "2025-07-25", weather_data)
 
-        assert mock_redis_client.setex.call_count == 2
+        assert pipe.setex.call_count == 2
+        pipe.delete.assert_called_once_with(
+            "weather:response:v1:london:2025-07-25", response_key
+        )
+        assert response_key not in local_response_cache
+        pipe.execute.assert_awaited_once()
+        mock_redis_client.setex.assert_not_called()
 
-        first_call = mock_redis_client.setex.call_args_list[0]
+        first_call = pipe.setex.call_args_list[0]
         assert first_call[0][0] == "weather:london:2025-07-25"
         assert first_call[0][1] == 3600
-        assert '"result"' in first_call[0][2]
+        assert b'"result"' in first_call[0][2]
 
     async def test_get_stale_weather(self, mock_redis_client):
         """Test getting stale weather data as fallback."""
@@ -71,19 +94,19 @@ class TestWeatherCacheService:
         stale_data = (
             '{"weather": [{"hour": 0, "temperature": "17", "condition": "Cloudy"}]}'
         )
-        mock_redis_client.get.side_effect = [
-            None,
-            stale_data,
-        ]
-
         cache_service = WeatherCacheService(mock_redis_client)
+        cache_service.stale_lookup.return_value = stale_data
 
         result = await cache_service.get_stale_weather("London", "2025-07-25")
 
         assert result is not None
         assert result["weather"][0]["temperature"] == "17"
 
-        assert mock_redis_client.get.call_count == 2
+        cache_service.stale_lookup.assert_awaited_once_with(
+            keys=["weather:london:2025-07-25:stale", "weather:london:2025-07-25"],
+            args=[86400],
+        )
+        mock_redis_client.get.assert_not_called()
 
     async def test_error_handling(self, mock_redis_client):
         """Test error handling in cache operations."""
@@ -95,3 +118,101 @@ class TestWeatherCacheService:
         result = await cache_service.get_weather("London", "2025-07-25")
 
         assert result is None
+
+    async def test_get_many(self, mock_redis_client):
+        """Test batched weather lookups use a single pipelined round-trip."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(
+            return_value=[['{"weather": []}', None, "not json"], 1800, -2, 5]
+        )
+        mock_redis_client.pipeline = MagicMock(return_value=pipe)
+
+        cache_service = WeatherCacheService(mock_redis_client)
+
+        result = await cache_service.get_many(
+            ["London", "Paris", "Tokyo"], "2025-07-25"
+        )
+
+        assert result == [({"weather": []}, 1800), (None, None), (None, None)]
+        pipe.mget.assert_called_once_with(
+            [
+                "weather:london:2025-07-25",
+                "weather:paris:2025-07-25",
+                "weather:tokyo:2025-07-25",
+            ]
+        )
+        assert pipe.ttl.call_count == 3
+        pipe.execute.assert_awaited_once()
+
+    async def test_get_many_falls_back_to_concurrent_gets(self, mock_redis_client):
+        """Test a failed batch lookup falls back to per-city lookups."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(side_effect=Exception("Redis down"))
+        mock_redis_client.pipeline = MagicMock(return_value=pipe)
+        mock_redis_client.get.side_effect = ['{"weather": []}', None]
+
+        cache_service = WeatherCacheService(mock_redis_client)
+
+        result = await cache_service.get_many(["London", "Paris"], "2025-07-25")
+
+        assert result == [({"weather": []}, None), (None, None)]
+        assert mock_redis_client.get.call_count == 2
+
+    async def test_get_response(self, mock_redis_client):
+        """Test getting a serialized response from cache."""
+
+        mock_redis_client.get.return_value = '{"weather": []}'
+
+        cache_service = WeatherCacheService(mock_redis_client)
+
+        result = await cache_service.get_response("London", "2025-07-25", "v1")
+
+        assert result == '{"weather": []}'
+        mock_redis_client.get.assert_called_once_with(
+            "weather:response:v1:london:2025-07-25"
+        )
+
+    async def test_get_response_error_is_miss(self, mock_redis_client):
+        """Test that response cache errors are treated as a miss."""
+
+        mock_redis_client.get.side_effect = Exception("Redis connection error")
+
+        cache_service = WeatherCacheService(mock_redis_client)
+
+        result = await cache_service.get_response("London", "2025-07-25", "v1")
+
+        assert result is None
+
+    async def test_set_response(self, mock_redis_client):
+        """Test storing a serialized response with the response TTL."""
+
+        cache_service = WeatherCacheService(mock_redis_client)
+
+        await cache_service.set_response("London", "2025-07-25", "v2", b"{}")
+
+        mock_redis_client.setex.assert_called_once_with(
+            "weather:response:v2:london:2025-07-25", 300, b"{}"
+        )
+
+    async def test_get_response_local_hit(self, mock_redis_client):
+        """Test that a stored response is served from the in-process cache."""
+
+        cache_service = WeatherCacheService(mock_redis_client)
+
+        await cache_service.set_response("London", "2025-07-25", "v1", b"{}")
+        result = await cache_service.get_response("London", "2025-07-25", "v1")
+
+        assert result == b"{}"
+        mock_redis_client.get.assert_not_called()
+
+    async def test_get_response_populates_local_cache(self, mock_redis_client):
+        """Test that a Redis response hit is copied into the local cache."""
+
+        mock_redis_client.get.return_value = "{}"
+
+        cache_service = WeatherCacheService(mock_redis_client)
+
+        await cache_service.get_response("London", "2025-07-25", "v2")
+        await cache_service.get_response("London", "2025-07-25", "v2")
+
+        mock_redis_client.get.assert_called_once()
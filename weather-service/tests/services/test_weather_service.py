@@ -2,9 +2,11 @@
 Tests for the weather service module.
 """
 
+import asyncio
 from datetime import date, datetime
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
+import orjson
 import pytest
 
 from app.schemas.api_v1 import WeatherResponse
@@ -85,6 +87,7 @@ class TestWeatherServiceV1:
             "London", date.today().isoformat()
         )
         weather_service.stats_tracker.increment_stats.assert_called_once_with("London")
+        weather_service.weather_cache.set_response.assert_called_once()
 
     async def test_get_weather_cache_miss_api_success(
         self, weather_service, sample_weather_data
@@ -140,6 +143,7 @@ class TestWeatherServiceV1:
 
         assert isinstance(result, WeatherResponse)
         assert len(result.weather) == 0  # Empty weather data
+        weather_service.weather_cache.set_response.assert_not_called()
         weather_service.queue_manager.add_to_queue.assert_called_once_with(
             "London", priority=10
         )
@@ -164,6 +168,116 @@ class TestWeatherServiceV1:
             assert isinstance(result, WeatherResponse)
             weather_service.weather_cache.get_stale_weather.assert_called_once()
 
+    async def test_concurrent_cache_misses_share_one_fetch(
+        self, weather_service, sample_weather_data
+    ):
+        """Test that concurrent misses for a city coalesce into one API call."""
+        weather_service.weather_cache.get_weather.return_value = None
+        weather_service.rate_limiter.consume_rate_limit_token.return_value = True
+
+        async def slow_fetch(city):
+            await asyncio.sleep(0.01)
+            return {"result": sample_weather_data}
+
+        with pytest.MonkeyPatch.context() as m:
+            mock_api = AsyncMock()
+            mock_api.fetch_weather.side_effect = slow_fetch
+            m.setattr("app.services.weather_service.dummy_weather_api", mock_api)
+
+            results = await asyncio.gather(
+                weather_service.get_weather("London", ApiVersion.V1),
+                weather_service.get_weather("london", ApiVersion.V2),
+            )
+
+            assert isinstance(results[0], WeatherResponse)
+            assert isinstance(results[1], WeatherResponseV2)
+            assert results[1].metadata.source == "api"
+            mock_api.fetch_weather.assert_called_once()
+            weather_service.rate_limiter.consume_rate_limit_token.assert_called_once()
+
+    async def test_concurrent_miss_followers_share_leader_error(self, weather_service):
+        """Test followers get the leader's error instead of a stale fallback."""
+        weather_service.weather_cache.get_weather.return_value = None
+
+        async def failing_consume():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("redis down")
+
+        weather_service.rate_limiter.consume_rate_limit_token.side_effect = (
+            failing_consume
+        )
+
+        results = await asyncio.gather(
+            weather_service.get_weather("London", ApiVersion.V1),
+            weather_service.get_weather("London", ApiVersion.V2),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        weather_service.rate_limiter.consume_rate_limit_token.assert_called_once()
+        weather_service.weather_cache.get_stale_weather.assert_not_called()
+        weather_service.queue_manager.add_to_queue.assert_not_called()
+
+    async def test_refresh_weather_fetches_cached_city(
+        self, weather_service, sample_weather_data
+    ):
+        """Test a warmer refresh fetches from the API even when cached.
+
+        The token was reserved by the warmer and the refresh is not a user
+        request, so no token is consumed and no stats are recorded.
+        """
+        weather_service.weather_cache.get_weather.return_value = {
+            "weather": sample_weather_data
+        }
+
+        with patch("app.services.weather_service.dummy_weather_api") as mock_api:
+            mock_api.fetch_weather = AsyncMock(
+                return_value={"result": sample_weather_data}
+            )
+            refreshed = await weather_service.refresh_weather("London")
+
+        assert refreshed is True
+        mock_api.fetch_weather.assert_awaited_once_with("London")
+        weather_service.weather_cache.get_weather.assert_not_called()
+        weather_service.weather_cache.set_weather.assert_awaited_once()
+        weather_service.rate_limiter.consume_rate_limit_token.assert_not_called()
+        weather_service.stats_tracker.increment_stats.assert_not_called()
+
+    async def test_get_cached_response_hit(self, weather_service):
+        """Test that a cached serialized response is returned and counted."""
+        weather_service.weather_cache.get_response.return_value = b'{"weather":[]}'
+
+        result = await weather_service.get_cached_response("London", ApiVersion.V1)
+
+        assert result == b'{"weather":[]}'
+        weather_service.weather_cache.get_response.assert_called_once_with(
+            "London", date.today().isoformat(), "v1"
+        )
+        weather_service.stats_tracker.increment_stats.assert_called_once_with("London")
+
+    async def test_get_cached_response_miss(self, weather_service):
+        """Test that a response cache miss is not counted."""
+        weather_service.weather_cache.get_response.return_value = None
+
+        result = await weather_service.get_cached_response("London", ApiVersion.V1)
+
+        assert result is None
+        weather_service.stats_tracker.increment_stats.assert_not_called()
+
+    def test_strip_temperature_units(self):
+        """Test the unit suffix is removed and other rows pass through."""
+        rows = [
+            {"hour": 0, "temperature": "18°C"},
+            {"hour": 1, "temperature": "-3 °C"},
+            {"hour": 2, "temperature": 21},
+        ]
+
+        result = WeatherService._strip_temperature_units(rows)
+
+        assert [row["temperature"] for row in result] == ["18", "-3", 21]
+        assert result[2] is rows[2]
+        assert rows[0]["temperature"] == "18°C"
+
 
 class TestWeatherServiceV2:
     """Test cases for WeatherServiceV2."""
@@ -187,6 +301,33 @@ class TestWeatherServiceV2:
         assert result.metadata.source == "cache"
         assert isinstance(result.metadata.last_updated, datetime)
 
+    async def test_cached_v2_response_reports_cache_source(
+        self, weather_service, sample_weather_data
+    ):
+        """Test a second v2 request served from the response cache says so.
+
+        The first request is fetched from the API; the bytes it stores are
+        what the next request returns.
+        """
+        weather_service.weather_cache.get_weather.return_value = None
+        weather_service.rate_limiter.consume_rate_limit_token.return_value = True
+
+        with patch("app.services.weather_service.dummy_weather_api") as mock_api:
+            mock_api.fetch_weather = AsyncMock(
+                return_value={"result": sample_weather_data}
+            )
+            first = await weather_service.get_weather("London", ApiVersion.V2)
+
+        assert first.metadata.source == "api"
+        payload = weather_service.weather_cache.set_response.await_args.args[3]
+        weather_service.weather_cache.get_response.return_value = payload
+
+        second = await weather_service.get_cached_response("London", ApiVersion.V2)
+
+        metadata = orjson.loads(second)["metadata"]
+        assert metadata["source"] == "cache"
+        assert metadata["data_freshness"] == "fresh"
+
     async def test_get_weather_v2_with_warnings(
         self, weather_service, sample_weather_data
     ):
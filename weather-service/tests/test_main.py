@@ -3,6 +3,7 @@ Tests for the main application module.
 """
 
 import pytest
+from fastapi.responses import ORJSONResponse
 from fastapi.testclient import TestClient
 
 from app.main import app
@@ -37,6 +38,10 @@ class TestMainApplication:
         assert app.redoc_url == "/redoc"
         assert app.openapi_url == "/openapi.json"
 
+    def test_default_response_class(self):
+        """Test routes without an explicit response class use orjson."""
+        assert app.router.default_response_class is ORJSONResponse
+
     def test_cors_middleware_added(self):
         """Test CORS middleware integration.
 
@@ -70,6 +75,55 @@ class TestMainApplication:
         assert any("/v2/health" in route for route in routes)
         assert any("/v2/metrics" in route for route in routes)
 
+    def test_routes_registered_once(self):
+        """Test that no path and method pair is registered twice.
+
+        Guards against a router being included more than once, which
+        would duplicate entries in the routing table.
+        """
+        registered = [
+            (route.path, method)
+            for route in app.routes
+            for method in getattr(route, "methods", None) or ()
+        ]
+
+        assert len(registered) == len(set(registered))
+
+    def test_api_routes_precede_metrics_route(self):
+        """Test API routes are matched before the metrics scrape route.
+
+        Starlette walks the routing table in order, so weather requests
+        should not be checked against the scrape endpoint first.
+        """
+        paths = [route.path for route in app.routes]
+
+        assert paths.index("/weather") < paths.index("/prometheus-metrics")
+        assert paths.index("/v2/weather") < paths.index("/prometheus-metrics")
+
+    def test_unhandled_exception_handler(self):
+        """Test unhandled errors become JSON 500s carrying the request ID.
+
+        The handler runs outside the request ID middleware, so it must
+        attach the correlation header itself.
+        """
+
+        async def boom():
+            raise RuntimeError("boom")
+
+        app.add_api_route("/_test_boom", boom)
+        try:
+            client = TestClient(app, raise_server_exceptions=False)
+            response = client.get("/_test_boom")
+        finally:
+            app.router.routes.pop()
+
+        assert response.status_code == 500
+        request_id = response.headers["X-Request-ID"]
+        assert response.json()["detail"] == {
+            "error": "Internal server error",
+            "request_id": request_id,
+        }
+
     def test_prometheus_metrics_endpoint(self):
         """Test Prometheus metrics endpoint availability.
 
@@ -78,3 +132,17 @@ class TestMainApplication:
         """
         routes = [route.path for route in app.routes]
         assert any("/prometheus-metrics" in route for route in routes)
+
+    def test_prometheus_metrics_excluded_paths(self):
+        """Test docs, health and scrape traffic are not instrumented.
+
+        These requests would otherwise add a histogram observation and
+        label series for every hit without being useful to monitor.
+        """
+        client = TestClient(app)
+
+        client.get("/openapi.json")
+        body = client.get("/prometheus-metrics").text
+
+        assert 'handler="/openapi.json"' not in body
+        assert 'handler="/prometheus-metrics"' not in body
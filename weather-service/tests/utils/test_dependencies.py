@@ -0,0 +1,68 @@
+"""
+Tests for the dependency injection providers.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.utils import dependencies
+from app.utils.dependencies import (
+    close_redis_pool,
+    get_queue_manager,
+    get_rate_limiter,
+    get_stats_tracker,
+    get_weather_cache,
+    get_weather_service,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_services():
+    """Isolate tests from the process-wide service instances."""
+    dependencies._services.clear()
+    yield
+    dependencies._services.clear()
+
+
+async def _resolve_weather_service(redis_client):
+    """Resolve the weather service the way FastAPI composes it."""
+    return await get_weather_service(
+        weather_cache=await get_weather_cache(redis_client),
+        rate_limiter=await get_rate_limiter(redis_client),
+        stats_tracker=await get_stats_tracker(redis_client),
+        queue_manager=await get_queue_manager(redis_client),
+    )
+
+
+class TestServiceProviders:
+    """Test cases for the service dependency providers."""
+
+    async def test_services_reused_across_requests(self):
+        """Test the same client yields the same service instances."""
+        redis_client = MagicMock()
+
+        first = await _resolve_weather_service(redis_client)
+        second = await _resolve_weather_service(redis_client)
+
+        assert first is second
+        assert first.weather_cache.redis_client is redis_client
+        # One Lua script each for the rate limiter, stale lookup and city stats
+        assert redis_client.register_script.call_count == 3
+
+    async def test_services_rebuilt_for_new_client(self):
+        """Test a different Redis client produces fresh service instances."""
+        first = await _resolve_weather_service(MagicMock())
+        second = await _resolve_weather_service(MagicMock())
+
+        assert first is not second
+        assert first.weather_cache is not second.weather_cache
+
+    async def test_close_redis_pool_drops_services(self):
+        """Test closing the pool discards the cached services."""
+        await _resolve_weather_service(MagicMock())
+
+        with patch.object(dependencies, "_redis_pool", AsyncMock()):
+            await close_redis_pool()
+
+        assert not dependencies._services
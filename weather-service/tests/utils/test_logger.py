@@ -0,0 +1,56 @@
+"""
+Tests for the logging utilities.
+"""
+
+import json
+import logging
+import sys
+from logging.handlers import QueueHandler
+
+from app.utils.logger import LOG_HANDLER, _create_handler, setup_logger
+
+
+class TestLogger:
+    """Test suite for logger setup."""
+
+    def test_setup_logger_is_idempotent(self):
+        """Test repeated setup does not attach duplicate handlers."""
+        logger = setup_logger("tests.logger.idempotent")
+        setup_logger("tests.logger.idempotent")
+
+        assert logger.handlers == [LOG_HANDLER]
+        assert logger.propagate is False
+
+    def test_loggers_share_handler(self):
+        """Test all loggers reuse the same handler and formatter."""
+        first = setup_logger("tests.logger.first")
+        second = setup_logger("tests.logger.second")
+
+        assert first.handlers[0] is second.handlers[0]
+
+    def test_handler_is_queued(self):
+        """Test loggers hand records to a queue instead of writing directly."""
+        assert isinstance(LOG_HANDLER, QueueHandler)
+
+    def test_queued_record_keeps_exception_info(self):
+        """Test tracebacks stay in a separate JSON field after queueing."""
+        logger = setup_logger("tests.logger.exception")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logger.makeRecord(
+                logger.name,
+                logging.ERROR,
+                __file__,
+                0,
+                "failed for %s",
+                ("London",),
+                sys.exc_info(),
+            )
+
+        prepared = LOG_HANDLER.prepare(record)
+        output = json.loads(_create_handler().formatter.format(prepared))
+
+        assert output["message"] == "failed for London"
+        assert "Traceback" in output["exc_info"]
+        assert "ValueError: boom" in output["exc_info"]
@@ -172,6 +172,27 @@ class TestResilientRedisPool:
                 assert mock_redis.called
                 assert client is not None
 
+    @pytest.mark.asyncio
+    async def test_pool_configuration(self, fast_retry_settings):
+        """Test the pool is sized and configured for long-lived connections.
+
+        Verifies the configured connection limit is applied and that
+        keepalive and periodic health checks are enabled on the pool.
+        """
+        pool = ResilientRedisPool("redis://localhost:6379", max_connections=200)
+
+        with patch("redis.asyncio.ConnectionPool.from_url") as mock_pool:
+            with patch("redis.asyncio.Redis"):
+                await pool.get_client()
+
+                kwargs = mock_pool.call_args.kwargs
+                assert kwargs["max_connections"] == 200
+                assert kwargs["socket_keepalive"] is True
+                assert (
+                    kwargs["health_check_interval"]
+                    == fast_retry_settings.redis_health_check_interval
+                )
+
     @pytest.mark.asyncio
     async def test_pool_reuse(self):
         """Test connection pool reuse for efficiency.